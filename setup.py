@@ -0,0 +1,37 @@
+"""Optional native build for the rule-based agents.
+
+Packaging metadata lives in pyproject.toml. This file only adds Cython
+extensions when ``SAR_CYTHONIZE=1`` is set and Cython is installed (the
+``fast`` extra); otherwise it is a plain pure-Python build.
+
+Local dev loop::
+
+    pip install -e ".[fast]"
+    SAR_CYTHONIZE=1 python setup.py build_ext --inplace
+
+The compiled ``.so`` files sit next to the sources and are picked up through
+the usual ``src.agents.*`` imports; delete them to fall back to pure Python.
+"""
+
+from __future__ import annotations
+
+import os
+
+from setuptools import setup
+
+# Pure dict/list walks with no dynamic tricks: safe to compile as-is
+CYTHON_MODULES = [
+    "src/agents/ingestion.py",
+    "src/agents/crime_detection.py",
+]
+
+ext_modules = []
+if os.getenv("SAR_CYTHONIZE") == "1":
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        print("SAR_CYTHONIZE=1 but Cython is not installed; building pure Python.")
+    else:
+        ext_modules = cythonize(CYTHON_MODULES, language_level=3, quiet=True)
+
+setup(ext_modules=ext_modules)
@@ -25,6 +25,9 @@ class Settings(BaseSettings):
     llm_model: str = Field(default="deepseek-chat", description="DeepSeek model name")
     llm_temperature: float = Field(default=0.1, description="LLM temperature for SAR generation")
     llm_max_tokens: int = Field(default=8192, description="LLM max output tokens")
+    max_llm_concurrency: int = Field(
+        default=4, description="Maximum graph nodes (LLM calls) run concurrently per step"
+    )
 
     # ── Compliance ──
     compliance_score_threshold: float = Field(
@@ -34,6 +37,14 @@ class Settings(BaseSettings):
         default=3, description="Maximum feedback iteration rounds"
     )
 
+    # ── UI ──
+    capture_traces: bool = Field(
+        default=True, description="Capture per-agent I/O snapshots in pipeline run traces"
+    )
+    trace_keep_full: bool = Field(
+        default=False, description="Keep trace snapshots and LLM text untruncated (debugging)"
+    )
+
     # ── Paths ──
     data_dir: Path = Field(default=PROJECT_ROOT / "data")
     samples_dir: Path = Field(default=PROJECT_ROOT / "data" / "samples")
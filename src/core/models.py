@@ -186,8 +186,10 @@ AGENT_IO_FIELDS: dict[str, dict[str, list[str]]] = {
 }
 
 # Nodes that call an LLM and should show streaming tokens.
-LLM_AGENT_NODES: set[str] = {"plan", "narrative", "compliance",
-                               "transaction_fraud", "payment_velocity",
-                               "country_risk", "text_content",
-                               "geo_anomaly", "account_health",
-                               "dispute_pattern"}
+LLM_AGENT_NODES: frozenset[str] = frozenset({
+    "plan", "narrative", "compliance",
+    "transaction_fraud", "payment_velocity",
+    "country_risk", "text_content",
+    "geo_anomaly", "account_health",
+    "dispute_pattern",
+})
@@ -11,11 +11,12 @@ from langgraph.graph import add_messages
 
 
 def _merge_dicts(left: dict[str, Any], right: dict[str, Any]) -> dict[str, Any]:
-    """Reducer that merges two dicts (used for typology_results from parallel agents)."""
-    merged = {**left} if left else {}
-    if right:
-        merged.update(right)
-    return merged
+    """Reducer that merges two dicts (used for typology_results from parallel agents).
+
+    Returns a new dict (right wins); neither input is mutated, as checkpointed
+    state must not change underneath LangGraph.
+    """
+    return (left or {}) | (right or {})
 
 
 class CrimeTypeResult(TypedDict):
@@ -32,29 +32,39 @@ TYPOLOGY_REGISTRY: dict[str, Any] = {
     "dispute_pattern": dispute_pattern_agent,
 }
 
+# State fields the typology agents read; everything else stays out of the Send payloads
+_TYPOLOGY_INPUT_KEYS: tuple[str, ...] = ("masked_data", "structured_data")
+
 
 def typology_dispatcher(state: SARState) -> list[Send]:
     """Fan-out: dispatch Send messages to activate selected typology agents.
 
     Uses the active_typology_agents list from the planning agent to
     dynamically decide which typology agents to run in parallel.
+
+    Every Send carries the same pruned payload (only the case data the
+    agents read), built once per dispatch. It stays a plain dict rather
+    than a read-only MappingProxyType because pending Sends are written
+    to the parent graph's checkpointer, whose serializer rejects proxies.
     """
     active = state.get("active_typology_agents", [])
     logger.info("Typology dispatcher: activating agents %s", active)
 
+    payload = {k: state[k] for k in _TYPOLOGY_INPUT_KEYS if k in state}
+
     sends = []
     for agent_name in active:
         if agent_name in TYPOLOGY_REGISTRY:
-            sends.append(Send(agent_name, state))
+            sends.append(Send(agent_name, payload))
         else:
             logger.warning("Unknown typology agent: %s (skipped)", agent_name)
 
     if not sends:
         logger.warning("No valid typology agents selected, using defaults")
         sends = [
-            Send("transaction_fraud", state),
-            Send("country_risk", state),
-            Send("account_health", state),
+            Send("transaction_fraud", payload),
+            Send("country_risk", payload),
+            Send("account_health", payload),
         ]
 
     return sends
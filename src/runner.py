@@ -20,11 +20,35 @@ import sys
 import uuid
 from pathlib import Path
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Ensure project root on sys.path
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+# Pipeline banners — built once at import, written with a single stdout call
+_RULE = "=" * 70
+_MINIMAL_BANNER = (
+    f"\n{_RULE}\n"
+    "  PHASE 1 — Minimal Pipeline (3 nodes)\n"
+    "  ingest → crime_detect → narrative → END\n"
+    f"{_RULE}\n\n"
+)
+_FULL_BANNER = (
+    f"\n{_RULE}\n"
+    "  PHASE 2 — Full Pipeline (10 nodes + typology subgraph)\n"
+    "  ingest → mask → crime_detect → plan → typology →\n"
+    "  [external_intel] → narrative → compliance → unmask → END\n"
+    f"{_RULE}\n\n"
+)
+_RESULTS_BANNER = f"\n{_RULE}\n  RESULTS\n{_RULE}\n"
+
 
 def _setup_logging(verbose: bool = False) -> None:
     level = logging.DEBUG if verbose else logging.INFO
@@ -45,8 +69,8 @@ def _load_case(path: str) -> dict:
     if not p.exists():
         print(f"[ERROR] Case file not found: {p}")
         sys.exit(1)
-    with open(p, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    raw = p.read_bytes()
+    data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
     print(f"[OK] Loaded case: {data.get('case_id', 'unknown')} from {p.name}")
     return data
 
@@ -55,10 +79,7 @@ def run_minimal(case_data: dict, verbose: bool = False) -> dict:
     """Execute Phase 1 minimal pipeline: ingest → crime_detect → narrative."""
     from src.graph.minimal_graph import build_minimal_graph
 
-    print("\n" + "=" * 70)
-    print("  PHASE 1 — Minimal Pipeline (3 nodes)")
-    print("  ingest → crime_detect → narrative → END")
-    print("=" * 70 + "\n")
+    sys.stdout.write(_MINIMAL_BANNER)
 
     app = build_minimal_graph()
     thread_id = str(uuid.uuid4())
@@ -81,11 +102,7 @@ def run_full(case_data: dict, interrupt: bool = True, verbose: bool = False) ->
     """Execute Phase 2 full pipeline with all agents and compliance loop."""
     from src.graph.sar_graph import build_sar_graph
 
-    print("\n" + "=" * 70)
-    print("  PHASE 2 — Full Pipeline (10 nodes + typology subgraph)")
-    print("  ingest → mask → crime_detect → plan → typology →")
-    print("  [external_intel] → narrative → compliance → unmask → END")
-    print("=" * 70 + "\n")
+    sys.stdout.write(_FULL_BANNER)
 
     interrupt_before = ["unmask"] if interrupt else []
     app = build_sar_graph(interrupt_before=interrupt_before)
@@ -118,9 +135,7 @@ def run_full(case_data: dict, interrupt: bool = True, verbose: bool = False) ->
 
 def _print_results(result: dict) -> None:
     """Pretty-print pipeline results."""
-    print("\n" + "=" * 70)
-    print("  RESULTS")
-    print("=" * 70)
+    sys.stdout.write(_RESULTS_BANNER)
 
     # Crime types
     crime_types = result.get("crime_types", [])
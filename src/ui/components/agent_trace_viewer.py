@@ -3,23 +3,32 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Mapping
 from typing import Any
 
 import streamlit as st
 
+from src.ui.session import LazySnapshot
+
 
 def render_agent_trace(
     trace: list[dict[str, Any]],
     *,
     title: str = "📊 Pipeline Agent Trace",
     expanded_default: bool = False,
+    key: str = "trace",
 ) -> None:
     """Render a list of AgentTraceEntry dicts as expandable sections.
 
+    ``input_snapshot``/``output_delta`` may be ``LazySnapshot`` mappings; a
+    collapsed section never reads them, so they are only materialized once
+    that agent's expander is opened.
+
     Args:
         trace: List of trace entry dicts from a pipeline run.
         title: Section title.
         expanded_default: Whether each agent expander starts open.
+        key: Widget-key prefix; must differ between traces shown on one page.
     """
     if not trace:
         st.info("No agent trace data available.")
@@ -39,14 +48,24 @@ def render_agent_trace(
         if has_llm:
             label += "  •  LLM"
 
-        with st.expander(label, expanded=expanded_default):
+        # Lazy expander: Streamlit runs a closed expander's body too, so skip it
+        with st.expander(
+            label,
+            expanded=expanded_default,
+            key=f"{key}_{i}_{node}",
+            on_change="rerun",
+        ) as node_expander:
+            if not node_expander.open:
+                continue
+
             col_in, col_out = st.columns(2)
 
             # ── Input snapshot ──
             with col_in:
                 st.markdown("**📥 Input**")
                 in_snap = entry.get("input_snapshot", {})
-                if in_snap:
+                # Truth-testing a LazySnapshot would materialize it via __len__
+                if isinstance(in_snap, LazySnapshot) or in_snap:
                     _render_dict(in_snap)
                 else:
                     st.caption("(no tracked input)")
@@ -55,7 +74,7 @@ def render_agent_trace(
             with col_out:
                 st.markdown("**📤 Output**")
                 out_snap = entry.get("output_delta", {})
-                if out_snap:
+                if isinstance(out_snap, LazySnapshot) or out_snap:
                     _render_dict(out_snap)
                 else:
                     st.caption("(no tracked output)")
@@ -97,7 +116,7 @@ def render_run_summary(run: dict[str, Any]) -> None:
 
 # ── Private helpers ──
 
-def _render_dict(d: dict[str, Any]) -> None:
+def _render_dict(d: Mapping[str, Any]) -> None:
     """Render a dict as key: value pairs, using json for complex values."""
     for key, val in d.items():
         if isinstance(val, str):
@@ -4,8 +4,17 @@ from __future__ import annotations
 
 from typing import Any
 
+import pandas as pd
+import pyarrow as pa
 import streamlit as st
 
+# Source fields read from each account / transaction when building the display tables
+_ACCOUNT_FIELDS = ["account_id", "account_type", "balance", "currency"]
+_TXN_FIELDS = [
+    "txn_id", "date", "type", "amount", "from_entity", "from_account",
+    "to_entity", "to_account", "from_country", "to_country", "risk_flags",
+]
+
 
 def render_subject_card(subject: dict[str, Any]) -> None:
     """Render subject profile card."""
@@ -32,13 +41,15 @@ def render_account_table(accounts: list[dict[str, Any]]) -> None:
         st.info("No account data available.")
         return
 
-    for acc in accounts:
-        with st.container():
-            cols = st.columns(4)
-            cols[0].metric("Account", acc.get("account_id", "N/A"))
-            cols[1].metric("Type", acc.get("account_type", "N/A"))
-            cols[2].metric("Balance", f"${acc.get('balance', 0):,.2f}")
-            cols[3].metric("Currency", acc.get("currency", "USD"))
+    df = pd.DataFrame(accounts).reindex(columns=_ACCOUNT_FIELDS)
+    display_df = pd.DataFrame({
+        "Account": df["account_id"].fillna("N/A"),
+        "Type": df["account_type"].fillna("N/A"),
+        "Balance": df["balance"].fillna(0).map("${:,.2f}".format),
+        "Currency": df["currency"].fillna("USD"),
+    })
+
+    st.dataframe(display_df, width='stretch', hide_index=True)
 
 
 def render_transaction_table(transactions: list[dict[str, Any]], summary: dict | None = None) -> None:
@@ -57,22 +68,24 @@ def render_transaction_table(transactions: list[dict[str, Any]], summary: dict |
         st.info("No transaction data.")
         return
 
-    # Build display table
-    display_data = []
-    for t in transactions:
-        flags = ", ".join(t.get("risk_flags", []))
-        display_data.append({
-            "ID": t.get("txn_id", ""),
-            "Date": t.get("date", ""),
-            "Type": t.get("type", ""),
-            "Amount": f"${t.get('amount', 0):,.2f}",
-            "From": t.get("from_entity", t.get("from_account", "")),
-            "To": t.get("to_entity", t.get("to_account", "")),
-            "Country": f"{t.get('from_country', '')}→{t.get('to_country', '')}",
-            "Risk Flags": flags or "—",
-        })
-
-    st.dataframe(display_data, width='stretch', hide_index=True)
+    # Build display table column-wise from a single DataFrame
+    df = pd.DataFrame(transactions).reindex(columns=_TXN_FIELDS)
+    display_df = pd.DataFrame({
+        "ID": df["txn_id"].fillna(""),
+        "Date": df["date"].fillna(""),
+        "Type": df["type"].fillna(""),
+        "Amount": df["amount"].fillna(0).map("${:,.2f}".format),
+        "From": df["from_entity"].fillna(df["from_account"]).fillna(""),
+        "To": df["to_entity"].fillna(df["to_account"]).fillna(""),
+        "Country": df["from_country"].fillna("") + "→" + df["to_country"].fillna(""),
+        "Risk Flags": df["risk_flags"].map(
+            lambda flags: ", ".join(flags) if isinstance(flags, list) and flags else "—"
+        ),
+    }).astype(pd.StringDtype())
+
+    # Hand Streamlit an Arrow table with explicit string columns (no schema inference)
+    table = pa.Table.from_pandas(display_df, preserve_index=False)
+    st.dataframe(table, width='stretch', hide_index=True)
 
 
 def render_case_overview(data: dict[str, Any]) -> None:
@@ -83,18 +96,20 @@ def render_case_overview(data: dict[str, Any]) -> None:
     with st.expander("Subject Profile", expanded=True):
         render_subject_card(data.get("subject", {}))
 
-    with st.expander("Accounts"):
-        render_account_table(data.get("accounts", []))
+    if data.get("accounts"):
+        with st.expander("Accounts"):
+            render_account_table(data["accounts"])
 
-    with st.expander("Transactions", expanded=True):
-        render_transaction_table(
-            data.get("transactions", []),
-            data.get("transaction_summary"),
-        )
+    if data.get("transactions"):
+        with st.expander("Transactions", expanded=True):
+            render_transaction_table(
+                data["transactions"],
+                data.get("transaction_summary"),
+            )
 
-    with st.expander("KYC Summary"):
-        kyc = data.get("kyc", {})
-        if kyc:
+    kyc = data.get("kyc")
+    if kyc:
+        with st.expander("KYC Summary"):
             col1, col2 = st.columns(2)
             with col1:
                 st.write(f"**Verification:** {kyc.get('verification_status', 'N/A')}")
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
+import pandas as pd
 import streamlit as st
 
 
@@ -24,8 +25,7 @@ def render_narrative_editor(
     # Chain of Thought reasoning
     if chain_of_thought:
         with st.expander("🧠 Chain-of-Thought Reasoning", expanded=False):
-            for i, step in enumerate(chain_of_thought, 1):
-                st.write(f"{i}. {step}")
+            st.markdown("\n".join(f"{i}. {step}" for i, step in enumerate(chain_of_thought, 1)))
 
     # Introduction section
     if intro:
@@ -75,18 +75,28 @@ def render_compliance_result(result: dict[str, Any] | None, score: float | None
     checks = result.get("checks", [])
     if checks:
         with st.expander("Detailed Checks", expanded=False):
-            for check in checks:
-                passed = check.get("passed", False)
-                icon = "✅" if passed else "❌"
-                st.write(f"{icon} **{check.get('dimension', 'Unknown')}** — {check.get('details', '')}")
-                st.progress(min(check.get("score", 0), 1.0))
+            checks_df = pd.DataFrame({
+                "": ["✅" if c.get("passed", False) else "❌" for c in checks],
+                "Dimension": [c.get("dimension", "Unknown") for c in checks],
+                "Details": [c.get("details", "") for c in checks],
+                "Score": [min(c.get("score", 0), 1.0) for c in checks],
+            })
+            st.dataframe(
+                checks_df,
+                width='stretch',
+                hide_index=True,
+                column_config={
+                    "Score": st.column_config.ProgressColumn(
+                        "Score", min_value=0.0, max_value=1.0, format="percent",
+                    ),
+                },
+            )
 
     # Improvement suggestions
     suggestions = result.get("improvement_suggestions", [])
     if suggestions:
         with st.expander("📋 Improvement Suggestions", expanded=True):
-            for i, s in enumerate(suggestions, 1):
-                st.write(f"{i}. {s}")
+            st.markdown("\n".join(f"{i}. {s}" for i, s in enumerate(suggestions, 1)))
 
 
 def render_feedback_form() -> str | None:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from typing import Any
 
 import streamlit as st
@@ -25,41 +26,106 @@ NODE_ORDER = [
     "external_intel", "narrative", "compliance", "feedback", "unmask",
 ]
 
+# Pre-rendered tracker lines per node state (built once at import)
+NODE_RENDERED_COMPLETED = {nid: f"🟢 ✅ **{label}**" for nid, (label, _) in NODE_LABELS.items()}
+NODE_RENDERED_CURRENT = {
+    nid: f"🔵 ⏳ **{label}** — *{description}*" for nid, (label, description) in NODE_LABELS.items()
+}
+NODE_RENDERED_PENDING = {nid: f"⬜ {label}" for nid, (label, _) in NODE_LABELS.items()}
+
+
+class BatchedStatusLog:
+    """Collects per-node status lines and renders them as one markdown element.
+
+    The element is re-rendered at most every ``max_lines`` new lines or
+    ``max_wait_s`` seconds, instead of one ``st.write`` per event. Call
+    ``break_segment()`` before writing other elements (e.g. an LLM stream)
+    so later lines start a new element below them; call ``flush()`` at the end.
+    """
+
+    def __init__(self, max_lines: int = 5, max_wait_s: float = 0.25) -> None:
+        self.max_lines = max_lines
+        self.max_wait_s = max_wait_s
+        self._lines: list[str] = []
+        self._pending = 0
+        self._last_flush = 0.0
+        self._placeholder = None
+
+    def add(self, line: str) -> None:
+        self._lines.append(line)
+        self._pending += 1
+        if self._pending >= self.max_lines or time.monotonic() - self._last_flush >= self.max_wait_s:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        if self._placeholder is None:
+            self._placeholder = st.empty()
+        self._placeholder.markdown("  \n".join(self._lines))
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+    def break_segment(self) -> None:
+        self.flush()
+        self._placeholder = None
+        self._lines = []
+
 
 def render_progress_tracker(
     completed_nodes: list[str],
     current_node: str | None = None,
     status: str = "idle",
 ) -> None:
-    """Render a visual progress tracker showing pipeline stage."""
+    """Render a visual progress tracker showing pipeline stage.
+
+    All stages are emitted as a single markdown element rather than one
+    widget per node.
+    """
     st.subheader("🔄 Pipeline Progress")
 
+    completed = set(completed_nodes)
+    lines: list[str] = []
     for node_id in NODE_ORDER:
-        label, description = NODE_LABELS.get(node_id, (node_id, ""))
-
-        if node_id in completed_nodes:
-            st.success(f"✅ {label}")
+        if node_id in completed:
+            lines.append(NODE_RENDERED_COMPLETED[node_id])
         elif node_id == current_node:
-            st.info(f"⏳ {label} — *{description}*")
+            lines.append(NODE_RENDERED_CURRENT[node_id])
         else:
-            st.write(f"⬜ {label}")
+            lines.append(NODE_RENDERED_PENDING[node_id])
+
+    st.markdown("\n\n".join(lines))
 
 
 def render_execution_log(log: list[dict[str, Any]]) -> None:
-    """Render execution log entries."""
+    """Render execution log entries, newest first.
+
+    Entries are bucketed by level so the log renders as at most three
+    elements (errors, warnings, info) regardless of its length.
+    """
     if not log:
         return
 
+    errors: list[str] = []
+    warnings: list[str] = []
+    infos: list[str] = []
+    for entry in reversed(log):
+        ts = entry.get("timestamp", "")
+        node = entry.get("node", "")
+        msg = entry.get("message", "")
+        level = entry.get("level", "info")
+
+        if level == "error":
+            errors.append(f"[{ts}] **{node}**: {msg}")
+        elif level == "warning":
+            warnings.append(f"[{ts}] **{node}**: {msg}")
+        else:
+            infos.append(f"🔵 `{ts}` **{node}**: {msg}")
+
     with st.expander("📜 Execution Log", expanded=False):
-        for entry in reversed(log):
-            ts = entry.get("timestamp", "")
-            node = entry.get("node", "")
-            msg = entry.get("message", "")
-            level = entry.get("level", "info")
-
-            if level == "error":
-                st.error(f"[{ts}] **{node}**: {msg}")
-            elif level == "warning":
-                st.warning(f"[{ts}] **{node}**: {msg}")
-            else:
-                st.write(f"`{ts}` **{node}**: {msg}")
+        if errors:
+            st.error("  \n".join(errors))
+        if warnings:
+            st.warning("  \n".join(warnings))
+        if infos:
+            st.markdown("  \n".join(infos))
@@ -2,17 +2,52 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
+import numpy as np
 import streamlit as st
 
-try:
-    import plotly.graph_objects as go
-    import plotly.express as px
 
-    HAS_PLOTLY = True
-except ImportError:
-    HAS_PLOTLY = False
+@lru_cache(maxsize=1)
+def _plotly_go() -> Any | None:
+    """Import plotly.graph_objects on first use (None if Plotly is unavailable).
+
+    Deferred so pages that never draw a chart don't pay Plotly's import cost.
+    """
+    try:
+        import plotly.graph_objects as go
+    except ImportError:
+        return None
+    return go
+
+
+@st.cache_data(show_spinner=False)
+def _build_crime_fig(types: tuple[str, ...], scores: tuple[float, ...]) -> Any:
+    """Build the crime-type confidence bar chart (cached per input)."""
+    go = _plotly_go()
+    scores_arr = np.asarray(scores, dtype=float)
+    colors = np.select(
+        [scores_arr > 0.5, scores_arr > 0.3], ["#e74c3c", "#f39c12"], default="#3498db"
+    )
+    labels = np.char.mod("%d%%", np.rint(scores_arr * 100).astype(int))
+
+    fig = go.Figure(go.Bar(
+        x=scores,
+        y=types,
+        orientation="h",
+        marker_color=colors.tolist(),
+        text=labels.tolist(),
+        textposition="auto",
+    ))
+    fig.update_layout(
+        title="Crime Type Confidence Scores",
+        xaxis_title="Confidence",
+        xaxis=dict(range=[0, 1]),
+        height=max(200, len(types) * 60),
+        margin=dict(l=10, r=10, t=40, b=10),
+    )
+    return fig
 
 
 def render_crime_type_chart(crime_types: list[dict[str, Any]] | None) -> None:
@@ -23,7 +58,7 @@ def render_crime_type_chart(crime_types: list[dict[str, Any]] | None) -> None:
 
     st.subheader("🎯 Detected Crime Types")
 
-    if not HAS_PLOTLY:
+    if _plotly_go() is None:
         # Fallback to text display
         for ct in crime_types:
             pct = ct.get("confidence", 0) * 100
@@ -31,25 +66,10 @@ def render_crime_type_chart(crime_types: list[dict[str, Any]] | None) -> None:
             st.progress(ct.get("confidence", 0))
         return
 
-    types = [ct.get("type", "unknown") for ct in crime_types]
-    scores = [ct.get("confidence", 0) for ct in crime_types]
+    types = tuple(ct.get("type", "unknown") for ct in crime_types)
+    scores = tuple(ct.get("confidence", 0) for ct in crime_types)
 
-    fig = go.Figure(go.Bar(
-        x=scores,
-        y=types,
-        orientation="h",
-        marker_color=["#e74c3c" if s > 0.5 else "#f39c12" if s > 0.3 else "#3498db" for s in scores],
-        text=[f"{s:.0%}" for s in scores],
-        textposition="auto",
-    ))
-    fig.update_layout(
-        title="Crime Type Confidence Scores",
-        xaxis_title="Confidence",
-        xaxis=dict(range=[0, 1]),
-        height=max(200, len(types) * 60),
-        margin=dict(l=10, r=10, t=40, b=10),
-    )
-    st.plotly_chart(fig, width='stretch')
+    st.plotly_chart(_build_crime_fig(types, scores), width='stretch')
 
 
 def render_risk_indicators(indicators: list[dict[str, Any]] | None) -> None:
@@ -60,16 +80,21 @@ def render_risk_indicators(indicators: list[dict[str, Any]] | None) -> None:
 
     st.subheader("⚠️ Risk Indicators")
 
+    # One markdown element for the whole section
+    blocks: list[str] = []
     for ind in indicators:
         severity = ind.get("severity", "unknown")
         icon = {"critical": "🔴", "high": "🟠", "medium": "🟡", "low": "🟢"}.get(severity, "⚪")
 
-        with st.container():
-            st.markdown(f"{icon} **{ind.get('type', 'Unknown').replace('_', ' ').title()}** — *{severity}*")
-            st.write(ind.get("description", ""))
-            if ind.get("evidence"):
-                st.caption(f"Evidence: {', '.join(str(e) for e in ind['evidence'])}")
-            st.divider()
+        block = (
+            f"{icon} **{ind.get('type', 'Unknown').replace('_', ' ').title()}** — *{severity}*  \n"
+            f"{ind.get('description', '')}"
+        )
+        if ind.get("evidence"):
+            block += f"  \n:gray[Evidence: {', '.join(str(e) for e in ind['evidence'])}]"
+        blocks.append(block)
+
+    st.markdown("\n\n---\n\n".join(blocks) + "\n\n---")
 
 
 def render_typology_results(results: dict[str, Any] | None) -> None:
@@ -98,7 +123,9 @@ def render_typology_results(results: dict[str, Any] | None) -> None:
             if not findings:
                 st.write("No suspicious findings.")
                 continue
+            lines: list[str] = []
             for f in findings:
                 sev = f.get("severity", "unknown")
                 icon = {"critical": "🔴", "high": "🟠", "medium": "🟡"}.get(sev, "🔵")
-                st.write(f"{icon} **{f.get('pattern', 'Unknown')}**: {f.get('detail', '')}")
+                lines.append(f"{icon} **{f.get('pattern', 'Unknown')}**: {f.get('detail', '')}")
+            st.markdown("  \n".join(lines))
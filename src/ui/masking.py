@@ -0,0 +1,58 @@
+"""PII masking helpers for UI display — pure functions, no Streamlit state.
+
+``reverse_map`` is the graph's ``mask_mapping``: placeholder → original value.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+
+@lru_cache(maxsize=16)
+def _alternation_pattern(needles: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile one regex matching any needle, longest first (ENTITY_10 before ENTITY_1)."""
+    ordered = sorted(needles, key=len, reverse=True)
+    return re.compile("|".join(re.escape(n) for n in ordered))
+
+
+def _replace_all(text: str, mapping: dict[str, str]) -> str:
+    """Replace every key of ``mapping`` in ``text`` in a single pass."""
+    pattern = _alternation_pattern(tuple(sorted(mapping)))
+    return pattern.sub(lambda m: mapping[m.group(0)], text)
+
+
+def unmask(text: str, reverse_map: dict[str, str]) -> str:
+    """Replace PII placeholders in ``text`` with their original values."""
+    if not text or not reverse_map:
+        return text
+    return _replace_all(text, reverse_map)
+
+
+def remask(text: str, reverse_map: dict[str, str]) -> str:
+    """Replace original PII values in ``text`` with their placeholders.
+
+    When several placeholders share an original, the first one wins; empty
+    originals are ignored.
+    """
+    if not text or not reverse_map:
+        return text
+    forward_map: dict[str, str] = {}
+    for placeholder, original in reverse_map.items():
+        if original:
+            forward_map.setdefault(original, placeholder)
+    if not forward_map:
+        return text
+    return _replace_all(text, forward_map)
+
+
+def preview(text: str, limit: int = 200) -> str:
+    """First ``limit`` characters of ``text``, cut back to the last space or newline.
+
+    Cutting on whitespace keeps placeholders whole, so the preview unmasks
+    cleanly. Falls back to a hard cut when no break lies in the second half.
+    """
+    if len(text) <= limit:
+        return text
+    idx = max(text.rfind(" ", 0, limit), text.rfind("\n", 0, limit))
+    return text[:idx if idx > limit // 2 else limit]
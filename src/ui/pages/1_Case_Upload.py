@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import sys
 from pathlib import Path
 
 import streamlit as st
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
@@ -17,6 +25,27 @@ from src.ui.components.case_viewer import render_case_overview
 from src.agents.ingestion import data_ingestion_agent
 from src.config import get_settings
 
+
+def _parse_json(raw_bytes: bytes) -> dict:
+    """Decode case JSON straight from bytes (orjson when available).
+
+    Both decoders raise a json.JSONDecodeError subclass on invalid input.
+    """
+    return orjson.loads(raw_bytes) if HAS_ORJSON else json.loads(raw_bytes)
+
+
+@st.cache_data(show_spinner=False)
+def _cached_ingest(raw_bytes: bytes) -> dict:
+    """Parse and ingest a case file, cached on the file's raw bytes."""
+    return data_ingestion_agent({"raw_data": _parse_json(raw_bytes)})["structured_data"]
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _list_samples(samples_dir: str, mtime: float) -> list[Path]:
+    """List sample case files; ``mtime`` keys the cache so new files invalidate it."""
+    return sorted(Path(samples_dir).glob("*.json"))
+
+
 init_session_state()
 
 st.title("📄 Case Upload")
@@ -32,18 +61,29 @@ with tab_upload:
     )
     if uploaded:
         try:
-            raw_data = json.loads(uploaded.read().decode("utf-8"))
-            reset_case_state()
-            st.session_state.case_data = raw_data
-            st.session_state.case_file_name = uploaded.name
+            raw_bytes = uploaded.getvalue()
+            case_hash = hashlib.blake2b(raw_bytes, digest_size=16).digest()
+            # Widget reruns re-deliver the same file; only reset on new content
+            if case_hash != st.session_state.get("case_data_hash"):
+                raw_data = _parse_json(raw_bytes)
+                reset_case_state()
+                st.session_state.case_data = raw_data
+                st.session_state.case_bytes = raw_bytes
+                st.session_state.case_data_hash = case_hash
+                st.session_state.case_file_name = uploaded.name
             st.success(f"✅ Loaded case file: {uploaded.name}")
         except json.JSONDecodeError as e:
             st.error(f"Invalid JSON: {e}")
 
 with tab_sample:
+    # get_settings() is an lru_cache'd process-wide singleton, so calling it
+    # on every rerun costs a dict lookup — no st.cache_resource wrapper needed
     settings = get_settings()
     samples_dir = settings.samples_dir
-    sample_files = sorted(samples_dir.glob("*.json")) if samples_dir.exists() else []
+    sample_files = (
+        _list_samples(str(samples_dir), samples_dir.stat().st_mtime)
+        if samples_dir.exists() else []
+    )
 
     if sample_files:
         selected = st.selectbox(
@@ -52,9 +92,12 @@ with tab_sample:
             format_func=lambda p: p.stem.replace("_", " ").title() + " (Sample data is fictional; do not associate it with the real world)",
         )
         if st.button("Load Sample", type="primary"):
-            raw_data = json.loads(selected.read_text(encoding="utf-8"))
+            raw_bytes = selected.read_bytes()
+            raw_data = _parse_json(raw_bytes)
             reset_case_state()
             st.session_state.case_data = raw_data
+            st.session_state.case_bytes = raw_bytes
+            st.session_state.case_data_hash = hashlib.blake2b(raw_bytes, digest_size=16).digest()
             st.session_state.case_file_name = selected.name
             st.success(f"✅ Loaded sample : {selected.name} (Sample data is fictional; do not associate it with the real world)")
     else:
@@ -65,11 +108,18 @@ if st.session_state.get("case_data"):
     st.divider()
     st.subheader("📋 Case Preview")
 
-    # Run quick ingestion for preview
-    if not st.session_state.get("structured_data"):
-        with st.spinner("Parsing case data..."):
-            result = data_ingestion_agent({"raw_data": st.session_state.case_data})
-            st.session_state.structured_data = result["structured_data"]
+    # Run quick ingestion for preview (cached per file content); skip it when
+    # structured_data already reflects the loaded file. The banners above are
+    # already sent, so they show while the status box runs.
+    case_hash = st.session_state.case_data_hash
+    if (
+        not st.session_state.get("structured_data")
+        or st.session_state.get("structured_data_hash") != case_hash
+    ):
+        with st.status("Parsing case data...") as status:
+            st.session_state.structured_data = _cached_ingest(st.session_state.case_bytes)
+            st.session_state.structured_data_hash = case_hash
+            status.update(label="Case data parsed", state="complete")
 
     render_case_overview(st.session_state.structured_data)
 
@@ -8,10 +8,9 @@ Features:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import sys
-import time
-import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -25,14 +24,18 @@ from src.ui.session import (
     init_session_state,
     update_from_graph_state,
     create_run,
-    add_trace_entry,
+    LazySnapshot,
+    add_trace_entries,
+    build_trace_entry,
     finish_run,
-    unmask_for_display,
+    get_graph_app,
+    get_graph_config,
+    new_thread_id,
+    unmask_for_display_cached,
 )
-from src.ui.components.progress_tracker import render_progress_tracker
+from src.ui.components.progress_tracker import BatchedStatusLog, render_progress_tracker
 from src.ui.components.risk_charts import render_crime_type_chart, render_risk_indicators
 from src.ui.components.agent_trace_viewer import render_agent_trace
-from src.graph.sar_graph import build_sar_graph
 from src.core.models import AGENT_IO_FIELDS, LLM_AGENT_NODES
 from src.config import get_settings
 
@@ -69,149 +72,279 @@ with col3:
 st.divider()
 
 
+# Per-node I/O field names, resolved once instead of per stream event
+_NODE_IN_FIELDS: dict[str, tuple[str, ...]] = {
+    n: tuple(v.get("input", ())) for n, v in AGENT_IO_FIELDS.items()
+}
+_NODE_OUT_FIELDS: dict[str, tuple[str, ...]] = {
+    n: tuple(v.get("output", ())) for n, v in AGENT_IO_FIELDS.items()
+}
+
+
 # ── Helper: extract input snapshot for a node from current session state ──
 
-def _snapshot_input(node_name: str) -> dict:
-    """Return a dict of the session-state fields this node reads as input."""
-    fields = AGENT_IO_FIELDS.get(node_name, {}).get("input", [])
-    snap: dict = {}
-    for f in fields:
+def _input_refs(node_name: str) -> dict:
+    """Return the current (untruncated) session-state values this node reads."""
+    refs: dict = {}
+    for f in _NODE_IN_FIELDS.get(node_name, ()):
         val = st.session_state.get(f)
         if val is not None:
-            # Truncate very large values for display
-            snap[f] = _truncate(val)
-    return snap
+            refs[f] = val
+    return refs
+
+
+def _truncate_fields(refs: dict, keep_full: bool = False) -> dict:
+    """Truncate very large values for display (unless ``keep_full``)."""
+    if keep_full:
+        return dict(refs)
+    return {f: _truncate(v) for f, v in refs.items()}
 
 
-def _snapshot_output(node_name: str, node_output: dict) -> dict:
+def _snapshot_input(node_name: str, keep_full: bool = False) -> dict:
+    """Return a dict of the session-state fields this node reads as input."""
+    return _truncate_fields(_input_refs(node_name), keep_full)
+
+
+def _snapshot_output(node_name: str, node_output: dict, keep_full: bool = False) -> dict:
     """Return only the output fields this node is expected to write."""
-    fields = AGENT_IO_FIELDS.get(node_name, {}).get("output", [])
+    fields = _NODE_OUT_FIELDS.get(node_name, ())
     out: dict = {}
     for f in fields:
         if f in node_output:
-            out[f] = _truncate(node_output[f])
+            out[f] = node_output[f]
     # Fallback: if no mapping, just use the raw output keys
     if not out:
-        for k, v in node_output.items():
-            out[k] = _truncate(v)
-    return out
+        out = dict(node_output)
+    return _truncate_fields(out, keep_full)
 
 
 def _truncate(value, max_str: int = 500, max_list: int = 10):
-    """Truncate large values for trace display."""
-    if isinstance(value, str) and len(value) > max_str:
-        return value[:max_str] + f"... ({len(value)} chars total)"
-    if isinstance(value, list) and len(value) > max_list:
-        return value[:max_list] + [f"... ({len(value)} items total)"]
-    if isinstance(value, dict) and len(str(value)) > max_str:
-        preview = str(value)[:max_str]
-        return {"__truncated__": preview + "..."}
+    """Truncate large values for trace display.
+
+    Dicts are sized by key count rather than by stringifying them; the trace
+    viewer caps the rendered JSON length anyway.
+    """
+    t = type(value)
+    if t is str:
+        return value if len(value) <= max_str else value[:max_str] + f"... ({len(value)} chars total)"
+    if t is list:
+        return value if len(value) <= max_list else value[:max_list] + [f"... ({len(value)} items total)"]
+    if t is dict and len(value) > max_list:
+        return {"__truncated__": f"dict with {len(value)} keys"}
     return value
 
 
-def _run_stream(app, initial_state, config, *, is_resume: bool = False):
-    """Execute the LangGraph stream with dual mode (updates + messages).
+# Minimum interval between LLM placeholder re-renders while tokens stream in
+_TOKEN_FLUSH_INTERVAL_S = 0.05
+# Only the tail of the streamed text is shown live; the trace keeps it all
+_LIVE_TAIL_CHARS = 2000
+
+
+async def _coalesce(stream, max_batch: int = 32, max_wait_s: float = 0.02):
+    """Group consecutive ``messages`` events into ``("messages_batch", [...])``.
+
+    A batch is emitted once it holds ``max_batch`` payloads, has been open for
+    ``max_wait_s`` (checked as events arrive), or an ``updates`` event comes in;
+    ``updates`` events are passed through unchanged, after any pending batch.
+    """
+    clock = asyncio.get_running_loop().time
+    batch: list = []
+    opened_at = 0.0
+    async for mode, payload in stream:
+        if mode == "messages":
+            if not batch:
+                opened_at = clock()
+            batch.append(payload)
+            if len(batch) >= max_batch or clock() - opened_at >= max_wait_s:
+                yield "messages_batch", batch
+                batch = []
+            continue
+        if batch:
+            yield "messages_batch", batch
+            batch = []
+        yield mode, payload
+    if batch:
+        yield "messages_batch", batch
+
+
+async def _consume_stream(
+    app,
+    stream_input,
+    config,
+    traces: list[dict],
+    log: list[dict],
+    status_log: BatchedStatusLog,
+) -> None:
+    """Drive ``app.astream`` in dual mode (updates + messages).
 
     Handles:
       - Per-node progress updates (updates events)
       - Real-time LLM token display (messages events)
       - I/O trace capture per node
+
+    Trace entries and execution-log lines are collected into ``traces`` and
+    ``log``; the caller commits them to session state once per run, and
+    flushes ``status_log``.
     """
+    loop = asyncio.get_running_loop()
+    settings = get_settings()
+    capture_traces = settings.capture_traces
+    keep_full = settings.trace_keep_full
     completed_nodes: list[str] = []
     # Track the current node for LLM streaming
     current_llm_node: str | None = None
-    llm_text_buffer: str = ""
+    llm_text_chunks: list[str] = []
     llm_placeholder = None
+    last_flush_ts: float = 0.0
     node_start_time: float | None = None
-    input_snap: dict = {}
+    node_start_iso = datetime.now(timezone.utc).isoformat()
+
+    # Local aliases for names used on every token event
+    clock = loop.time
+    llm_nodes = LLM_AGENT_NODES
+    flush_interval = _TOKEN_FLUSH_INTERVAL_S
+    append_token = llm_text_chunks.append  # list is cleared, never rebound
+
+    async for mode, payload in _coalesce(app.astream(
+        stream_input,
+        config,
+        stream_mode=["updates", "messages"],
+    )):
+        if mode == "messages_batch":
+            saw_newline = False
+            # each payload is a tuple (AIMessageChunk, metadata_dict)
+            for chunk, metadata in payload:
+                node = metadata.get("langgraph_node", "")
+
+                # Only render for LLM nodes
+                if node not in llm_nodes:
+                    continue
+
+                # Start a new streaming block for this node
+                if node != current_llm_node:
+                    # Flush previous buffer
+                    if llm_placeholder is not None and llm_text_chunks:
+                        llm_placeholder.code("".join(llm_text_chunks)[-_LIVE_TAIL_CHARS:], language=None)
+                    current_llm_node = node
+                    llm_text_chunks.clear()
+                    status_log.break_segment()
+                    st.write(f"🚀 **{node}** — LLM streaming:")
+                    llm_placeholder = st.empty()
+                    last_flush_ts = 0.0
+
+                token = chunk.content if hasattr(chunk, "content") else str(chunk)
+                if token:
+                    append_token(token)
+                    saw_newline = saw_newline or "\n" in token
+
+            # One render per batch, and at most every ~50ms unless a line
+            # break arrived; the node-completion flush shows the rest
+            now = clock()
+            if llm_placeholder is not None and llm_text_chunks and (
+                now - last_flush_ts > flush_interval or saw_newline
+            ):
+                llm_placeholder.code("".join(llm_text_chunks)[-_LIVE_TAIL_CHARS:], language=None)
+                last_flush_ts = now
+
+        elif mode == "updates":
+            for node_name, node_output in payload.items():
+                # Skip LangGraph internal/system events (not real agent nodes)
+                if node_name.startswith("__") or node_name == "interrupt":
+                    continue
+
+                # Calculate duration
+                t_now = clock()
+                duration_ms = int((t_now - node_start_time) * 1000) if node_start_time else 0
+
+                # One clock read per node: UTC for the trace, local time for display
+                finished = datetime.now(timezone.utc)
+                finished_iso = finished.isoformat()
+                timestamp = finished.astimezone().strftime("%H:%M:%S")
+                status_log.add(f"✅ `{timestamp}` — **{node_name}** completed")
+
+                completed_nodes.append(node_name)
+                log.append({
+                    "timestamp": timestamp,
+                    "node": node_name,
+                    "message": "Completed",
+                    "level": "info",
+                })
+
+                # Capture I/O trace
+                has_llm = node_name in llm_nodes
+                if not capture_traces:
+                    in_snap, out_snap = {}, {}
+                elif has_llm:
+                    in_snap = _snapshot_input(node_name, keep_full)
+                    out_snap = (
+                        _snapshot_output(node_name, node_output, keep_full)
+                        if isinstance(node_output, dict) else {}
+                    )
+                else:
+                    # Non-LLM traces are rarely inspected. Truncate now so the
+                    # run history never pins raw node output or session values;
+                    # the viewer only reads the snapshot once it is opened
+                    in_snap = LazySnapshot(_snapshot_input(node_name, keep_full).copy)
+                    out_snap = (
+                        LazySnapshot(_snapshot_output(node_name, node_output, keep_full).copy)
+                        if isinstance(node_output, dict) else {}
+                    )
+                llm_text = "".join(llm_text_chunks) if (has_llm and llm_text_chunks) else None
+
+                traces.append(build_trace_entry(
+                    node_name=node_name,
+                    started_at=node_start_iso,
+                    finished_at=finished_iso,
+                    duration_ms=duration_ms,
+                    input_snapshot=in_snap,
+                    output_delta=out_snap,
+                    has_llm_call=has_llm,
+                    llm_stream_text=llm_text,
+                ))
+
+                # Flush the final text, then reset LLM buffer after node completion
+                if node_name == current_llm_node:
+                    if llm_placeholder is not None and llm_text:
+                        llm_placeholder.code(llm_text[-_LIVE_TAIL_CHARS:], language=None)
+                    llm_text_chunks.clear()
+                    current_llm_node = None
+                    llm_placeholder = None
+
+                # Update session state from outputs (skip empty passthrough updates)
+                if isinstance(node_output, dict) and node_output:
+                    update_from_graph_state(node_output)
+
+                # Start timing next node
+                node_start_time = clock()
+                node_start_iso = finished_iso
 
+
+def _run_stream(app, initial_state, config, *, is_resume: bool = False):
+    """Execute the LangGraph stream and record the run outcome.
+
+    The stream is consumed with ``app.astream`` on a fresh event loop per
+    run, so reruns never hit an already-running loop.
+    """
     label = "Resuming pipeline..." if is_resume else "Running SAR pipeline..."
 
     with st.status(label, expanded=True) as status_widget:
         try:
             stream_input = None if is_resume else initial_state
 
-            for event in app.stream(
-                stream_input,
-                config,
-                stream_mode=["updates", "messages"],
-            ):
-                mode, payload = event
-
-                if mode == "messages":
-                    # payload is a tuple (AIMessageChunk, metadata_dict)
-                    chunk, metadata = payload
-                    node = metadata.get("langgraph_node", "")
-
-                    # Only render for LLM nodes
-                    if node not in LLM_AGENT_NODES:
-                        continue
-
-                    # Start a new streaming block for this node
-                    if node != current_llm_node:
-                        # Flush previous buffer
-                        current_llm_node = node
-                        llm_text_buffer = ""
-                        st.write(f"🚀 **{node}** — LLM streaming:")
-                        llm_placeholder = st.empty()
-
-                    token = chunk.content if hasattr(chunk, "content") else str(chunk)
-                    if token:
-                        llm_text_buffer += token
-                        if llm_placeholder is not None:
-                            llm_placeholder.markdown(f"```\n{llm_text_buffer}\n```")
-
-                elif mode == "updates":
-                    for node_name, node_output in payload.items():
-                        # Skip LangGraph internal/system events (not real agent nodes)
-                        if node_name.startswith("__") or node_name == "interrupt":
-                            continue
-
-                        # Calculate duration
-                        t_now = time.time()
-                        duration_ms = int((t_now - node_start_time) * 1000) if node_start_time else 0
-
-                        timestamp = datetime.now().strftime("%H:%M:%S")
-                        st.write(f"✅ `{timestamp}` — **{node_name}** completed")
-
-                        completed_nodes.append(node_name)
-                        st.session_state.execution_log.append({
-                            "timestamp": timestamp,
-                            "node": node_name,
-                            "message": "Completed",
-                            "level": "info",
-                        })
-
-                        # Capture I/O trace
-                        in_snap = _snapshot_input(node_name)
-                        out_snap = _snapshot_output(node_name, node_output) if isinstance(node_output, dict) else {}
-
-                        has_llm = node_name in LLM_AGENT_NODES
-                        llm_text = llm_text_buffer if (has_llm and llm_text_buffer) else None
-
-                        add_trace_entry(
-                            node_name=node_name,
-                            started_at=datetime.now(timezone.utc).isoformat(),
-                            finished_at=datetime.now(timezone.utc).isoformat(),
-                            duration_ms=duration_ms,
-                            input_snapshot=in_snap,
-                            output_delta=out_snap,
-                            has_llm_call=has_llm,
-                            llm_stream_text=llm_text,
-                        )
-
-                        # Reset LLM buffer after node completion
-                        if node_name == current_llm_node:
-                            llm_text_buffer = ""
-                            current_llm_node = None
-                            llm_placeholder = None
-
-                        # Update session state from outputs
-                        if isinstance(node_output, dict):
-                            update_from_graph_state(node_output)
-
-                        # Start timing next node
-                        node_start_time = time.time()
+            traces: list[dict] = []
+            log: list[dict] = []
+            status_log = BatchedStatusLog()
+            loop = asyncio.new_event_loop()
+            try:
+                loop.run_until_complete(
+                    _consume_stream(app, stream_input, config, traces, log, status_log)
+                )
+            finally:
+                loop.close()
+                status_log.flush()
+                # Commit what was captured, including on error, in one write each
+                st.session_state.execution_log.extend(log)
+                add_trace_entries(traces)
 
             # Check if interrupted (paused at unmask)
             snapshot = app.get_state(config)
@@ -234,14 +367,12 @@ def _run_stream(app, initial_state, config, *, is_resume: bool = False):
 # ── Run pipeline ──
 if run_pipeline:
     st.session_state.execution_status = "running"
-    st.session_state.thread_id = str(uuid.uuid4())
+    new_thread_id()
 
-    # Build graph
-    with st.spinner("Building agent graph..."):
-        app = build_sar_graph(interrupt_before=["unmask"])
-        st.session_state.graph_app = app
+    app = get_graph_app(("unmask",))
+    st.session_state.thread_checkpointed = True
 
-    config = {"configurable": {"thread_id": st.session_state.thread_id}}
+    config = get_graph_config()
     initial_state = {
         "raw_data": st.session_state.case_data,
         "iteration_count": 0,
@@ -255,9 +386,9 @@ if run_pipeline:
     st.rerun()
 
 # ── Resume pipeline (after HITL review) ──
-if resume and st.session_state.get("graph_app"):
-    app = st.session_state.graph_app
-    config = {"configurable": {"thread_id": st.session_state.thread_id}}
+if resume:
+    app = get_graph_app(("unmask",))
+    config = get_graph_config()
     st.session_state.execution_status = "running"
 
     # Create a new run record for the resume leg
@@ -268,19 +399,19 @@ if resume and st.session_state.get("graph_app"):
 
 # ── Display agent trace (if available) ──
 current_run = st.session_state.get("current_run")
-last_run_trace = None
+last_run = None
 
 # Prefer the current run; fall back to the most recent history entry
 if current_run and current_run.get("agents_trace"):
-    last_run_trace = current_run["agents_trace"]
+    last_run = current_run
 else:
     history = st.session_state.get("run_history", [])
     if history and history[-1].get("agents_trace"):
-        last_run_trace = history[-1]["agents_trace"]
+        last_run = history[-1]
 
-if last_run_trace:
+if last_run:
     st.divider()
-    render_agent_trace(last_run_trace)
+    render_agent_trace(last_run["agents_trace"], key=f"trace_{last_run['run_id']}")
 
 # ── Display current results ──
 col_left, col_right = st.columns([1, 1])
@@ -295,7 +426,7 @@ with col_right:
 if st.session_state.get("narrative_draft"):
     st.divider()
     st.subheader("📝 Narrative Draft Preview")
-    _preview_text = unmask_for_display(st.session_state.narrative_draft)
+    _preview_text = unmask_for_display_cached(st.session_state.narrative_draft, "sar_preview")
     st.markdown(_preview_text[:2000])
     if len(_preview_text) > 2000:
         st.caption("... (navigate to Narrative Review for full text)")
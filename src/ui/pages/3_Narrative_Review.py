@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import sys
+from functools import partial
 from pathlib import Path
 
 import streamlit as st
@@ -12,12 +14,17 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.ui.session import (
+    dumps_json,
+    get_graph_app,
+    get_graph_config,
     init_session_state,
     update_from_graph_state,
     update_run_status,
     unmask_for_display,
+    unmask_for_display_cached,
     remask_text,
 )
+from src.ui.masking import unmask
 from src.ui.components.narrative_editor import (
     render_compliance_result,
     render_feedback_form,
@@ -25,45 +32,79 @@ from src.ui.components.narrative_editor import (
 from src.ui.components.agent_trace_viewer import render_agent_trace
 
 
-def _local_unmask_text(text: str, reverse_map: dict[str, str]) -> str:
-    """Best-effort local unmask when graph instance is not available."""
-    result = text
-    for placeholder, original in reverse_map.items():
-        result = result.replace(placeholder, original)
-    return result
+async def _resume_graph(app, config, values: dict, on_node=None, into: dict | None = None) -> None:
+    """Write ``values`` into the paused graph and stream it to the next stop.
+
+    Node outputs go to session state per event, or, when ``into`` is given,
+    are merged into that dict for the caller to apply in one update.
+    """
+    await app.aupdate_state(config, values)
+    async for event in app.astream(None, config, stream_mode="updates"):
+        if on_node is not None:
+            for node_name in event:
+                on_node(node_name)
+        for node_output in event.values():
+            if isinstance(node_output, dict) and node_output:
+                if into is not None:
+                    into.update(node_output)
+                else:
+                    update_from_graph_state(node_output)
+
+
+def _run_resume(app, config, values: dict, on_node=None, into: dict | None = None) -> None:
+    """Drive ``_resume_graph`` on a fresh event loop (safe across reruns)."""
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(_resume_graph(app, config, values, on_node, into))
+    finally:
+        loop.close()
+
+
+def _export_json(export_data: dict) -> bytes:
+    """Serialise the report export; called by the download button on click."""
+    return dumps_json(export_data)
 
 init_session_state()
 
 st.title("✏️ Narrative Review")
 
-if not st.session_state.get("narrative_draft"):
+# Read the fields this page renders once; writes below still go through st.session_state
+ss = st.session_state
+narrative_draft = ss.get("narrative_draft")
+final_narrative = ss.get("final_narrative")
+case_id = ss.get("case_id")
+
+if not narrative_draft:
     st.warning("⚠️ No narrative generated yet. Please run the pipeline on **SAR Generate** page first.")
     st.stop()
 
 # ── Display compliance result ──
-render_compliance_result(
-    st.session_state.get("compliance_result"),
-    st.session_state.get("compliance_score"),
-)
+compliance_score = ss.get("compliance_score")
+render_compliance_result(ss.get("compliance_result"), compliance_score)
 
 st.divider()
 
 # ── Chain of Thought ──
-cot = st.session_state.get("chain_of_thought")
+cot = ss.get("chain_of_thought")
 if cot:
-    with st.expander("🧠 Chain-of-Thought Reasoning", expanded=False):
-        for i, step in enumerate(cot, 1):
-            st.write(f"{i}. {unmask_for_display(step) if isinstance(step, str) else step}")
+    # Lazy expander: the steps are only joined/unmasked while it is open
+    with st.expander(
+        "🧠 Chain-of-Thought Reasoning", expanded=False, key="cot_expander", on_change="rerun"
+    ) as cot_expander:
+        if cot_expander.open:
+            cot_md = "\n".join(f"{i}. {step}" for i, step in enumerate(cot, 1))
+            st.markdown(unmask_for_display_cached(cot_md, "review_cot"))
 
 # ── Narrative display/edit ──
-is_final = st.session_state.get("final_narrative") is not None
-_raw_narrative = st.session_state.get("final_narrative") or st.session_state.get("narrative_draft") or ""
-narrative = unmask_for_display(_raw_narrative)
+is_final = final_narrative is not None
+_raw_narrative = final_narrative or narrative_draft or ""
+narrative = unmask_for_display_cached(_raw_narrative, "review_narrative")
 
 st.subheader("📄 SAR Narrative" + (" (Final)" if is_final else " (Draft)"))
 
-if st.session_state.get("narrative_intro"):
-    st.markdown(f"**Introduction:** {unmask_for_display(st.session_state.narrative_intro)}")
+narrative_intro = ss.get("narrative_intro")
+if narrative_intro:
+    st.markdown(f"**Introduction:** {unmask_for_display(narrative_intro)}")
     st.divider()
 
 edited_narrative = st.text_area(
@@ -77,8 +118,8 @@ edited_narrative_text = edited_narrative or ""
 st.divider()
 
 # ── Feedback / Approve section ──
-iteration = st.session_state.get("iteration_count", 0)
-max_iter = st.session_state.get("max_iterations", 3) if "max_iterations" in st.session_state else 3
+iteration = ss.get("iteration_count", 0)
+max_iter = ss.get("max_iterations", 3)
 
 st.caption(f"Iteration: {iteration} / {max_iter}")
 
@@ -90,17 +131,22 @@ if not is_final:
         st.session_state.execution_status = "running"
 
         # If graph is paused, resume it
-        app = st.session_state.get("graph_app")
-        if app and st.session_state.get("thread_id"):
-            config = {"configurable": {"thread_id": st.session_state.thread_id}}
+        if st.session_state.get("thread_id"):
+            app = get_graph_app(("unmask",))
+            config = get_graph_config()
+            # Node outputs are merged here and land in session state in one update
+            merged: dict = {}
             try:
                 # Re-mask user edits before writing back to graph (LLM must not see real PII)
-                app.update_state(config, {"narrative_draft": remask_text(edited_narrative_text)})
-
-                for event in app.stream(None, config, stream_mode="updates"):
-                    for node_name, node_output in event.items():
-                        if isinstance(node_output, dict):
-                            update_from_graph_state(node_output)
+                try:
+                    _run_resume(
+                        app,
+                        config,
+                        {"narrative_draft": remask_text(edited_narrative_text)},
+                        into=merged,
+                    )
+                finally:
+                    update_from_graph_state(merged)
 
                 # Finalize status once unmask has produced final output
                 if st.session_state.get("final_narrative"):
@@ -116,11 +162,11 @@ if not is_final:
             # Fallback path: local unmask if mapping exists, avoid leaving masked final text.
             reverse_map = st.session_state.get("mask_mapping") or {}
             if reverse_map:
-                st.session_state.final_narrative = _local_unmask_text(edited_narrative_text, reverse_map)
+                st.session_state.final_narrative = unmask(edited_narrative_text, reverse_map)
                 cot = st.session_state.get("chain_of_thought") or []
                 if isinstance(cot, list):
                     st.session_state.chain_of_thought = [
-                        _local_unmask_text(step, reverse_map) if isinstance(step, str) else step
+                        unmask(step, reverse_map) if isinstance(step, str) else step
                         for step in cot
                     ]
                 st.session_state.execution_status = "completed"
@@ -137,30 +183,33 @@ if not is_final:
         # Submit feedback for regeneration
         st.session_state.human_feedback = feedback_result
 
-        app = st.session_state.get("graph_app")
-        if app and st.session_state.get("thread_id"):
-            config = {"configurable": {"thread_id": st.session_state.thread_id}}
-
-            # Update graph state with feedback (re-mask edits so LLM never sees real PII)
-            app.update_state(
-                config,
-                {
-                    "human_feedback": feedback_result,
-                    "narrative_draft": remask_text(edited_narrative_text),
-                },
-            )
+        if st.session_state.get("thread_id"):
+            app = get_graph_app(("unmask",))
+            config = get_graph_config()
 
             st.info("🔄 Regenerating narrative with your feedback...")
 
-            with st.status("Regenerating..."):
+            with st.status("Regenerating...", expanded=True) as status:
+                # Progress is one relabelled status; state lands in one update at the end
+                buffered: dict = {}
                 try:
-                    for event in app.stream(None, config, stream_mode="updates"):
-                        for node_name, node_output in event.items():
-                            st.write(f"✅ **{node_name}** completed")
-                            if isinstance(node_output, dict):
-                                update_from_graph_state(node_output)
+                    # Update graph state with feedback (re-mask edits so LLM never sees real PII)
+                    _run_resume(
+                        app,
+                        config,
+                        {
+                            "human_feedback": feedback_result,
+                            "narrative_draft": remask_text(edited_narrative_text),
+                        },
+                        on_node=lambda node_name: status.update(label=f"✅ {node_name} completed"),
+                        into=buffered,
+                    )
+                    status.update(label="Regeneration complete", state="complete")
                 except Exception as e:
+                    status.update(label="Regeneration failed", state="error")
                     st.error(f"Error during regeneration: {e}")
+                finally:
+                    update_from_graph_state(buffered)
 
             st.rerun()
         else:
@@ -176,23 +225,22 @@ else:
         st.download_button(
             "📥 Download Narrative (TXT)",
             data=narrative_text,
-            file_name=f"SAR_{st.session_state.get('case_id', 'unknown')}.txt",
+            file_name=f"SAR_{case_id or 'unknown'}.txt",
             mime="text/plain",
         )
     with col2:
-        import json
         export_data = {
-            "case_id": st.session_state.get("case_id"),
+            "case_id": case_id,
             "narrative": narrative_text,
-            "compliance_score": st.session_state.get("compliance_score"),
-            "crime_types": st.session_state.get("crime_types"),
-            "risk_indicators": st.session_state.get("risk_indicators"),
+            "compliance_score": compliance_score,
+            "crime_types": ss.get("crime_types"),
+            "risk_indicators": ss.get("risk_indicators"),
             "iterations": iteration,
         }
         st.download_button(
             "📥 Download Full Report (JSON)",
-            data=json.dumps(export_data, indent=2, ensure_ascii=False),
-            file_name=f"SAR_Report_{st.session_state.get('case_id', 'unknown')}.json",
+            data=partial(_export_json, export_data),
+            file_name=f"SAR_Report_{case_id or 'unknown'}.json",
             mime="application/json",
         )
 
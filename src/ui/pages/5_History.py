@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import sys
 from pathlib import Path
 
@@ -12,42 +11,43 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from src.ui.session import init_session_state, unmask_for_display
+from src.ui.session import dumps_json, init_session_state, unmask_for_display_cached
 from src.ui.components.agent_trace_viewer import render_agent_trace, render_run_summary
 
 init_session_state()
 
-st.title("📋 Pipeline Run History")
-
-history: list[dict] = st.session_state.get("run_history", [])
-
-if not history:
-    st.info("No pipeline runs yet in this session. Generate a SAR report to see it here.")
-    st.stop()
-
-st.caption(f"{len(history)} run(s) in current session")
-
-for idx, run in enumerate(reversed(history)):
-    run_num = len(history) - idx
+# Status badge per run status
+_STATUS_ICONS = {
+    "completed": "✅",
+    "approved": "🟢",
+    "rejected": "🔴",
+    "review": "⏸️",
+    "running": "🔄",
+    "error": "❌",
+}
+
+
+@st.fragment
+def _render_run(run: dict, idx: int, total: int) -> None:
+    """Render one run's expander; toggling or preparing it reruns only this fragment."""
+    run_num = total - idx
     case_id = run.get("case_id", "Unknown")
     started = run.get("started_at", "N/A")
     status = run.get("status", "unknown")
 
     # Status badge
-    status_icons = {
-        "completed": "✅",
-        "approved": "🟢",
-        "rejected": "🔴",
-        "review": "⏸️",
-        "running": "🔄",
-        "error": "❌",
-    }
-    icon = status_icons.get(status, "❓")
+    icon = _STATUS_ICONS.get(status, "❓")
 
+    # Lazy expander: a collapsed run's tabs, trace and JSON are only built once opened
     with st.expander(
         f"{icon} Run #{run_num} — {case_id} — {status.upper()} — {started[:19]}",
         expanded=(idx == 0),
-    ):
+        key=f"run_expander_{run.get('run_id', run_num)}",
+        on_change="rerun",
+    ) as run_expander:
+        if not run_expander.open:
+            return
+
         # Summary metrics
         render_run_summary(run)
 
@@ -58,7 +58,9 @@ for idx, run in enumerate(reversed(history)):
 
         with tab_narrative:
             _raw_narr = run.get("final_narrative", "")
-            narrative = unmask_for_display(_raw_narr) if _raw_narr else ""
+            narrative = (
+                unmask_for_display_cached(_raw_narr, f"history:{run.get('run_id')}") if _raw_narr else ""
+            )
             if narrative:
                 st.markdown(narrative[:3000])
                 if len(narrative) > 3000:
@@ -79,20 +81,57 @@ for idx, run in enumerate(reversed(history)):
         with tab_trace:
             trace = run.get("agents_trace", [])
             if trace:
-                render_agent_trace(trace, title="", expanded_default=False)
+                render_agent_trace(
+                    trace, title="", expanded_default=False, key=f"trace_{run.get('run_id', run_num)}"
+                )
             else:
                 st.caption("No agent trace data for this run.")
 
         with tab_json:
-            # Download full run record as JSON
-            run_json = json.dumps(run, indent=2, ensure_ascii=False, default=str)
-            st.download_button(
-                "📥 Download Run Data (JSON)",
-                data=run_json,
-                file_name=f"run_{run.get('run_id', 'unknown')}.json",
-                mime="application/json",
-                key=f"dl_run_{idx}",
-            )
-            st.code(run_json[:5000], language="json")
-            if len(run_json) > 5000:
-                st.caption(f"... ({len(run_json)} chars total — download for full data)")
+            # Serialise the run record only on request; the prepared bytes are
+            # kept (tagged with the run's status) until the run changes
+            run_id = run.get("run_id", "unknown")
+            json_key = f"run_json_{run_id}"
+            prepared = st.session_state.get(json_key)
+            if prepared is not None and prepared[0] != run.get("status"):
+                prepared = None
+            if prepared is None and st.button("🗂️ Prepare JSON", key=f"prep_run_{run_id}"):
+                prepared = (run.get("status"), dumps_json(run))
+                st.session_state[json_key] = prepared
+
+            if prepared is None:
+                st.caption("Prepare the run record to preview or download it as JSON.")
+            else:
+                run_json = prepared[1]
+                st.download_button(
+                    "📥 Download Run Data (JSON)",
+                    data=run_json,
+                    file_name=f"run_{run_id}.json",
+                    mime="application/json",
+                    key=f"dl_run_{run_id}",
+                )
+                st.code(run_json[:5000].decode("utf-8", errors="ignore"), language="json")
+                if len(run_json) > 5000:
+                    st.caption(f"... ({len(run_json)} bytes total — download for full data)")
+
+
+st.title("📋 Pipeline Run History")
+
+history: list[dict] = st.session_state.get("run_history", [])
+
+if not history:
+    st.info("No pipeline runs yet in this session. Generate a SAR report to see it here.")
+    st.stop()
+
+st.caption(f"{len(history)} run(s) in current session")
+
+# Pagination: only the current page of runs (newest first) is rendered
+total = len(history)
+page_size = st.sidebar.selectbox("Runs per page", [5, 10, 25, 50], index=1)
+page_count = max(1, -(-total // page_size))
+page = st.sidebar.number_input("Page", min_value=1, max_value=page_count, value=1)
+offset = (page - 1) * page_size
+ordered = history[::-1]
+
+for idx, run in enumerate(ordered[offset:offset + page_size], start=offset):
+    _render_run(run, idx, total)
@@ -2,67 +2,101 @@
 
 from __future__ import annotations
 
+import copy
+import json
 import uuid
+from collections.abc import Callable, Iterator, Mapping
 from datetime import datetime, timezone
 from typing import Any
 
 import streamlit as st
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+from src.config import get_settings
+from src.ui.masking import preview, remask, unmask
+
+
+# Session state defaults, built once at import
+_DEFAULTS: dict[str, Any] = {
+    # App state
+    "app_initialized": False,
+    "current_page": "home",
+    # Case data
+    "case_data": None,
+    "case_bytes": None,      # raw case file bytes (cache key for ingestion)
+    "case_data_hash": None,  # blake2b digest of case_bytes
+    "case_id": None,
+    "case_file_name": None,
+    # Graph execution
+    "thread_id": None,
+    "graph_config": None,    # LangGraph run config for thread_id (see get_graph_config)
+    "thread_checkpointed": False,  # thread_id has been run on the shared graph
+    "execution_status": "idle",  # idle | running | paused | completed | error
+    "execution_log": [],
+    # Results
+    "structured_data": None,
+    "structured_data_hash": None,  # case_data_hash that structured_data was built from
+    "masked_data": None,
+    "mask_mapping": None,
+    "mask_mapping_version": 0,  # bumped whenever mask_mapping changes
+    "unmask_cache": {},         # slot -> (text, mapping version, unmasked text)
+    "risk_indicators": None,
+    "crime_types": None,
+    "typology_results": None,
+    "external_intel": None,
+    "narrative_draft": None,
+    "narrative_intro": None,
+    "chain_of_thought": None,
+    "compliance_result": None,
+    "compliance_score": None,
+    "final_narrative": None,
+    # HITL
+    "human_feedback": None,
+    "iteration_count": 0,
+    # History & tracing
+    "run_history": [],       # list[PipelineRunRecord dicts]
+    "current_run": None,     # current PipelineRunRecord dict (while running)
+    "completed_cases": [],   # legacy — kept for backward compat
+}
+
 
 def init_session_state() -> None:
-    """Initialize all session state variables with defaults."""
-    defaults: dict[str, Any] = {
-        # App state
-        "app_initialized": False,
-        "current_page": "home",
-        # Case data
-        "case_data": None,
-        "case_id": None,
-        "case_file_name": None,
-        # Graph execution
-        "graph_app": None,
-        "thread_id": None,
-        "execution_status": "idle",  # idle | running | paused | completed | error
-        "execution_log": [],
-        # Results
-        "structured_data": None,
-        "masked_data": None,
-        "mask_mapping": None,
-        "risk_indicators": None,
-        "crime_types": None,
-        "typology_results": None,
-        "external_intel": None,
-        "narrative_draft": None,
-        "narrative_intro": None,
-        "chain_of_thought": None,
-        "compliance_result": None,
-        "compliance_score": None,
-        "final_narrative": None,
-        # HITL
-        "human_feedback": None,
-        "iteration_count": 0,
-        # History & tracing
-        "run_history": [],       # list[PipelineRunRecord dicts]
-        "current_run": None,     # current PipelineRunRecord dict (while running)
-        "completed_cases": [],   # legacy — kept for backward compat
-    }
+    """Initialize all session state variables with defaults.
 
-    for key, default in defaults.items():
-        if key not in st.session_state:
-            st.session_state[key] = default
+    Runs once per session: every page calls this on every rerun, so after the
+    first call it returns as soon as it sees ``app_initialized``.
+    """
+    if st.session_state.get("app_initialized"):
+        return
+    missing = _DEFAULTS.keys() - st.session_state.keys()
+    if missing:
+        # Copy so mutable defaults ([] / {}) are never shared between sessions
+        st.session_state.update({k: copy.copy(_DEFAULTS[k]) for k in missing})
+    st.session_state.app_initialized = True
 
 
 def reset_case_state() -> None:
     """Reset case-specific state for a new analysis."""
     st.session_state.case_data = None
+    st.session_state.case_bytes = None
+    st.session_state.case_data_hash = None
     st.session_state.case_id = None
     st.session_state.case_file_name = None
-    st.session_state.thread_id = str(uuid.uuid4())
+    new_thread_id()
     st.session_state.execution_status = "idle"
     st.session_state.execution_log = []
     st.session_state.structured_data = None
+    st.session_state.structured_data_hash = None
     st.session_state.masked_data = None
     st.session_state.mask_mapping = None
+    st.session_state.mask_mapping_version = st.session_state.get("mask_mapping_version", 0) + 1
+    st.session_state.unmask_cache = {}
     st.session_state.risk_indicators = None
     st.session_state.crime_types = None
     st.session_state.typology_results = None
@@ -78,17 +112,95 @@ def reset_case_state() -> None:
     st.session_state.current_run = None
 
 
-def update_from_graph_state(state: dict[str, Any]) -> None:
-    """Update session state from a LangGraph state snapshot."""
-    field_mappings = [
-        "structured_data", "masked_data", "mask_mapping", "risk_indicators", "crime_types",
-        "typology_results", "external_intel", "narrative_draft", "narrative_intro",
-        "chain_of_thought", "compliance_result", "compliance_score",
-        "final_narrative", "human_feedback", "iteration_count",
-    ]
-    for field in field_mappings:
-        if field in state:
-            st.session_state[field] = state[field]
+@st.cache_resource(show_spinner="Building agent graph...")
+def get_graph_app(interrupt_before: tuple[str, ...] = ("unmask",)):
+    """Return the compiled SAR graph, built once per process and shared.
+
+    Sessions are isolated by ``thread_id`` in the graph's checkpointer, so
+    session state only needs to hold the thread id; switch threads through
+    ``new_thread_id`` so replaced threads are freed.
+    """
+    from src.graph.sar_graph import build_sar_graph
+
+    return build_sar_graph(interrupt_before=list(interrupt_before))
+
+
+def get_graph_config() -> dict[str, Any]:
+    """Return the LangGraph run config for the current thread_id.
+
+    Built once per thread and kept in session state; every page passes this
+    same dict to stream/update_state/get_state. ``max_concurrency`` caps how
+    many graph nodes (and so LLM calls) run at once.
+    """
+    config = st.session_state.get("graph_config")
+    thread_id = st.session_state.get("thread_id")
+    if config is None or config["configurable"]["thread_id"] != thread_id:
+        config = {
+            "configurable": {"thread_id": thread_id},
+            "max_concurrency": get_settings().max_llm_concurrency,
+        }
+        st.session_state.graph_config = config
+    return config
+
+
+def reset_graph_config() -> None:
+    """Drop the cached run config; call whenever thread_id changes."""
+    st.session_state.graph_config = None
+
+
+def new_thread_id() -> str:
+    """Switch the session to a fresh graph thread and return its id.
+
+    The shared graph's checkpointer outlives every session, so the previous
+    thread's checkpoints (full case, masked data, narratives) are deleted
+    first rather than kept for the life of the process. Threads that were
+    never run (``thread_checkpointed`` unset) have nothing to delete, so
+    e.g. the upload page never builds the graph.
+    """
+    old_id = st.session_state.get("thread_id")
+    if old_id and st.session_state.get("thread_checkpointed"):
+        # Same args as the pages, so this hits the same cache_resource entry
+        checkpointer = get_graph_app(("unmask",)).checkpointer
+        # Early langgraph 0.2.x MemorySaver has no delete_thread
+        delete_thread = getattr(checkpointer, "delete_thread", None)
+        if delete_thread is not None:
+            delete_thread(old_id)
+    thread_id = str(uuid.uuid4())
+    st.session_state.thread_id = thread_id
+    st.session_state.thread_checkpointed = False
+    reset_graph_config()
+    return thread_id
+
+
+# Graph state fields mirrored into session state by update_from_graph_state
+_GRAPH_STATE_FIELDS: frozenset[str] = frozenset({
+    "structured_data", "masked_data", "mask_mapping", "risk_indicators", "crime_types",
+    "typology_results", "external_intel", "narrative_draft", "narrative_intro",
+    "chain_of_thought", "compliance_result", "compliance_score",
+    "final_narrative", "human_feedback", "iteration_count",
+})
+
+
+def update_from_graph_state(
+    state: dict[str, Any],
+    known_fields: frozenset[str] = _GRAPH_STATE_FIELDS,
+) -> None:
+    """Update session state from a LangGraph state snapshot.
+
+    Only keys in ``known_fields`` (by default every mirrored field; a narrower
+    set restricts the update further) are copied, so the work is bounded by
+    the keys actually present in ``state``.
+    """
+    if not state:
+        return
+    prev_mapping = st.session_state.get("mask_mapping")
+    updates = {k: state[k] for k in state.keys() & known_fields & _GRAPH_STATE_FIELDS}
+    if updates:
+        st.session_state.update(updates)
+
+    # Invalidate cached unmasked text when the PII mapping changes
+    if "mask_mapping" in state and state["mask_mapping"] != prev_mapping:
+        st.session_state.mask_mapping_version = st.session_state.get("mask_mapping_version", 0) + 1
 
     # Update case_id from raw_data or structured_data
     if "structured_data" in state and state["structured_data"]:
@@ -102,6 +214,19 @@ def update_from_graph_state(state: dict[str, Any]) -> None:
 
 # ── Pipeline Run Record helpers ──
 
+# Oldest runs are dropped beyond this many, to bound session memory
+MAX_RUN_HISTORY = 200
+# Per-entry cap on streamed LLM text (lifted by settings.trace_keep_full)
+TRACE_MAX_LLM_CHARS = 8192
+# Narrative preview kept on each run record (cut on a word boundary)
+NARRATIVE_PREVIEW_CHARS = 200
+
+
+def _cap_str(value: Any, limit: int) -> Any:
+    if isinstance(value, str) and len(value) > limit:
+        return value[:limit] + "…"
+    return value
+
 
 def create_run(mode: str = "full") -> dict[str, Any]:
     """Create a new PipelineRunRecord and set it as current_run.
@@ -120,6 +245,7 @@ def create_run(mode: str = "full") -> dict[str, Any]:
         "compliance_score": None,
         "compliance_status": None,
         "narrative_preview": "",
+        "narrative_preview_unmasked": "",
         "final_narrative": "",
         "iteration_count": 0,
         "agents_trace": [],
@@ -128,21 +254,77 @@ def create_run(mode: str = "full") -> dict[str, Any]:
     return run
 
 
-def add_trace_entry(
+class LazySnapshot(Mapping[str, Any]):
+    """Trace snapshot whose dict is only built on first read.
+
+    Used for ``input_snapshot``/``output_delta`` of nodes whose trace is rarely
+    inspected; the factory holds only already-truncated values, and the trace
+    viewer leaves it unread until that node's expander is opened.
+    Consumers should treat it as a read-only mapping; ``materialize()`` returns
+    the plain dict (e.g. before JSON export). Pickles as a plain dict.
+    """
+
+    __slots__ = ("_factory", "_data")
+
+    def __init__(self, factory: Callable[[], dict[str, Any]]) -> None:
+        self._factory: Callable[[], dict[str, Any]] | None = factory
+        self._data: dict[str, Any] | None = None
+
+    def materialize(self) -> dict[str, Any]:
+        if self._data is None:
+            self._data = self._factory()
+            self._factory = None
+        return self._data
+
+    def __getitem__(self, key: str) -> Any:
+        return self.materialize()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.materialize())
+
+    def __len__(self) -> int:
+        return len(self.materialize())
+
+    def __reduce__(self):
+        return (dict, (self.materialize(),))
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialise trace snapshots as their dicts; anything else via str()."""
+    if isinstance(obj, LazySnapshot):
+        return obj.materialize()
+    return str(obj)
+
+
+def dumps_json(obj: Any) -> bytes:
+    """Pretty-printed UTF-8 JSON bytes for downloads, via orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            default=_json_default,
+        )
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default).encode("utf-8")
+
+
+def build_trace_entry(
     node_name: str,
     started_at: str,
     finished_at: str,
     duration_ms: int,
-    input_snapshot: dict[str, Any],
-    output_delta: dict[str, Any],
+    input_snapshot: Mapping[str, Any],
+    output_delta: Mapping[str, Any],
     has_llm_call: bool = False,
     llm_stream_text: str | None = None,
-) -> None:
-    """Append an AgentTraceEntry to the current run."""
-    run = st.session_state.get("current_run")
-    if run is None:
-        return
-    entry: dict[str, Any] = {
+) -> dict[str, Any]:
+    """Build an AgentTraceEntry dict without touching session state.
+
+    Snapshots are stored as given (the caller truncates them for display);
+    the LLM stream text is capped unless ``trace_keep_full`` is set.
+    """
+    if not get_settings().trace_keep_full:
+        llm_stream_text = _cap_str(llm_stream_text, TRACE_MAX_LLM_CHARS)
+    return {
         "node_name": node_name,
         "started_at": started_at,
         "finished_at": finished_at,
@@ -152,7 +334,46 @@ def add_trace_entry(
         "has_llm_call": has_llm_call,
         "llm_stream_text": llm_stream_text,
     }
-    run["agents_trace"].append(entry)
+
+
+def add_trace_entry(
+    node_name: str,
+    started_at: str,
+    finished_at: str,
+    duration_ms: int,
+    input_snapshot: dict[str, Any],
+    output_delta: dict[str, Any],
+    has_llm_call: bool = False,
+    llm_stream_text: str | None = None,
+) -> None:
+    """Append an AgentTraceEntry to the current run."""
+    add_trace_entries([build_trace_entry(
+        node_name,
+        started_at,
+        finished_at,
+        duration_ms,
+        input_snapshot,
+        output_delta,
+        has_llm_call,
+        llm_stream_text,
+    )])
+
+
+def add_trace_entries(entries: list[dict[str, Any]]) -> None:
+    """Append a batch of AgentTraceEntry dicts to the current run in one write."""
+    run = st.session_state.get("current_run")
+    if run is None or not entries:
+        return
+    run["agents_trace"].extend(entries)
+
+
+def _set_narrative_preview(run: dict[str, Any], narrative: str) -> None:
+    """Store the run's preview, masked and unmasked with the current mapping."""
+    narrative_preview = preview(narrative, NARRATIVE_PREVIEW_CHARS)
+    run["narrative_preview"] = narrative_preview
+    run["narrative_preview_unmasked"] = unmask(
+        narrative_preview, st.session_state.get("mask_mapping") or {}
+    )
 
 
 def finish_run(
@@ -178,12 +399,12 @@ def finish_run(
 
     narrative = st.session_state.get("final_narrative") or st.session_state.get("narrative_draft") or ""
     run["final_narrative"] = narrative
-    run["narrative_preview"] = narrative[:200]
+    _set_narrative_preview(run, narrative)
 
     # Append to history list
     history: list[dict[str, Any]] = st.session_state.get("run_history", [])
     history.append(run)
-    st.session_state.run_history = history
+    st.session_state.run_history = history[-MAX_RUN_HISTORY:]
     st.session_state.current_run = None
 
 
@@ -195,7 +416,7 @@ def update_run_status(status: str) -> None:
         # Also refresh narrative in case it was finalized after approve
         narrative = st.session_state.get("final_narrative") or history[-1].get("final_narrative", "")
         history[-1]["final_narrative"] = narrative
-        history[-1]["narrative_preview"] = narrative[:200]
+        _set_narrative_preview(history[-1], narrative)
 
 
 # ── PII display helpers (UI-only, never persisted back to graph) ──
@@ -210,12 +431,26 @@ def unmask_for_display(text: str) -> str:
     """
     if not text:
         return text
-    reverse_map: dict[str, str] = st.session_state.get("mask_mapping") or {}
-    if not reverse_map:
+    return unmask(text, st.session_state.get("mask_mapping") or {})
+
+
+def unmask_for_display_cached(text: str, slot: str) -> str:
+    """``unmask_for_display`` memoised per session under a named slot.
+
+    For text that is re-displayed on every rerun but rarely changes (e.g. the
+    narrative preview). The cache is keyed on the text and on
+    ``mask_mapping_version``, and lives in session state so unmasked PII is
+    never shared across sessions.
+    """
+    if not text:
         return text
-    result = text
-    for placeholder, original in reverse_map.items():
-        result = result.replace(placeholder, original)
+    version = st.session_state.get("mask_mapping_version", 0)
+    cache: dict[str, tuple[str, int, str]] = st.session_state.setdefault("unmask_cache", {})
+    hit = cache.get(slot)
+    if hit is not None and hit[1] == version and (hit[0] is text or hit[0] == text):
+        return hit[2]
+    result = unmask_for_display(text)
+    cache[slot] = (text, version, result)
     return result
 
 
@@ -227,11 +462,4 @@ def remask_text(text: str) -> str:
     """
     if not text:
         return text
-    reverse_map: dict[str, str] = st.session_state.get("mask_mapping") or {}
-    if not reverse_map:
-        return text
-    result = text
-    # reverse_map is placeholder→original; we need original→placeholder
-    for placeholder, original in reverse_map.items():
-        result = result.replace(original, placeholder)
-    return result
+    return remask(text, st.session_state.get("mask_mapping") or {})
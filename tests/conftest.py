@@ -0,0 +1,110 @@
+"""Shared test helpers and fixtures."""
+
+from __future__ import annotations
+
+import copy
+import functools
+import itertools
+import json
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, TypeVar
+
+import pytest
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Resolved once per session; test modules import these instead of walking parents
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SAMPLES_DIR = REPO_ROOT / "data" / "samples"
+HAS_ENV = (REPO_ROOT / ".env").exists()
+
+# Opt-in wall-clock budget for one unit test's call phase (e.g. SAR_UNIT_TEST_BUDGET_S=0.2).
+# Off by default: on a loaded machine (xdist workers, shared CI runners) it
+# would fail tests that are merely slow to get scheduled.
+UNIT_TEST_BUDGET_S = float(os.getenv("SAR_UNIT_TEST_BUDGET_S", "0"))
+_UNIT_DIR = REPO_ROOT / "tests" / "unit"
+
+T = TypeVar("T")
+
+_thread_ids = itertools.count()
+
+
+def next_thread_id() -> str:
+    """Process-unique LangGraph thread_id (each test process has its own MemorySaver)."""
+    return f"test-{next(_thread_ids)}"
+
+
+@functools.lru_cache(maxsize=None)
+def load_sample(name: str) -> dict:
+    """Parse ``data/samples/<name>`` once per test session.
+
+    The returned dict is shared between callers; deep-copy it before
+    mutating.
+    """
+    p = SAMPLES_DIR / name
+    assert p.exists(), f"Sample file not found: {p}"
+    raw = p.read_bytes()
+    return orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+
+
+def unchanged(data: T) -> Iterator[T]:
+    """Yield ``data`` for a shared (module-scoped) fixture; fail at teardown if a test mutated it.
+
+    Use as ``yield from unchanged(...)`` in the fixture body.
+    """
+    snapshot = copy.deepcopy(data)
+    yield data
+    assert data == snapshot, "shared fixture data was mutated by a test"
+
+
+def freeze(obj: Any) -> Any:
+    """Read-only view of JSON-shaped data: dicts → MappingProxyType, lists → tuples.
+
+    For shared fixtures, so an accidental in-place write fails in the test that
+    makes it instead of corrupting later ones.
+    """
+    if isinstance(obj, dict):
+        return MappingProxyType({k: freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(freeze(v) for v in obj)
+    return obj
+
+
+def thaw(obj: Any) -> Any:
+    """Mutable deep copy of ``freeze`` output (plain dicts and lists again)."""
+    if isinstance(obj, (dict, MappingProxyType)):
+        return {k: thaw(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [thaw(v) for v in obj]
+    return obj
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo):
+    """Fail a passing unit test whose call phase ran over ``UNIT_TEST_BUDGET_S`` (when set).
+
+    Hypothesis property tests run many examples per call and are exempt.
+    """
+    outcome = yield
+    report = outcome.get_result()
+    if (
+        UNIT_TEST_BUDGET_S > 0
+        and report.when == "call"
+        and report.passed
+        and _UNIT_DIR in item.path.parents
+        and not getattr(getattr(item, "obj", None), "is_hypothesis_test", False)
+        and report.duration > UNIT_TEST_BUDGET_S
+    ):
+        report.outcome = "failed"
+        report.longrepr = (
+            f"unit test took {report.duration:.3f}s, over the "
+            f"{UNIT_TEST_BUDGET_S:.3f}s budget (SAR_UNIT_TEST_BUDGET_S)"
+        )
@@ -3,32 +3,26 @@
 Tests the complete 10-node SAR graph with all agents, typology subgraph,
 compliance validation, and feedback loop.
 
-These tests require a valid DeepSeek API key in .env.
+The full-graph tests require a valid DeepSeek API key in .env and are marked
+``live_llm`` (deselected by default; opt in with ``-m live_llm``).
 """
 
 from __future__ import annotations
 
-import json
 import os
-import uuid
-from pathlib import Path
 
 import pytest
 
-pytestmark = pytest.mark.skipif(
-    not os.getenv("LLM_API_KEY") and not Path(__file__).resolve().parents[2].joinpath(".env").exists(),
+from tests.conftest import HAS_ENV, load_sample, next_thread_id
+
+requires_llm_key = pytest.mark.skipif(
+    not os.getenv("LLM_API_KEY") and not HAS_ENV,
     reason="LLM_API_KEY not set — skipping integration tests",
 )
 
-SAMPLES_DIR = Path(__file__).resolve().parents[2] / "data" / "samples"
-
-
-def _load_sample(name: str) -> dict:
-    p = SAMPLES_DIR / name
-    assert p.exists(), f"Sample file not found: {p}"
-    return json.loads(p.read_text(encoding="utf-8"))
-
 
+@pytest.mark.live_llm
+@requires_llm_key
 class TestFullPipeline:
     """Integration tests for the Phase 2 full graph."""
 
@@ -36,9 +30,9 @@ class TestFullPipeline:
         """End-to-end full pipeline without HITL interrupt."""
         from src.graph.sar_graph import build_sar_graph
 
-        case_data = _load_sample("case_structuring.json")
+        case_data = load_sample("case_structuring.json")
         app = build_sar_graph(interrupt_before=[])
-        config = {"configurable": {"thread_id": str(uuid.uuid4())}}
+        config = {"configurable": {"thread_id": next_thread_id()}}
 
         result = app.invoke(
             {"raw_data": case_data, "iteration_count": 0, "max_iterations": 3},
@@ -74,9 +68,9 @@ class TestFullPipeline:
         """Test HITL: pipeline pauses before unmask, then resumes."""
         from src.graph.sar_graph import build_sar_graph
 
-        case_data = _load_sample("case_structuring.json")
+        case_data = load_sample("case_structuring.json")
         app = build_sar_graph(interrupt_before=["unmask"])
-        config = {"configurable": {"thread_id": str(uuid.uuid4())}}
+        config = {"configurable": {"thread_id": next_thread_id()}}
 
         # First invoke — should pause at unmask
         result = app.invoke(
@@ -104,7 +98,7 @@ class TestTypologySubgraph:
         subgraph = build_typology_subgraph().compile()
 
         state = {
-            "structured_data": _load_sample("case_structuring.json"),
+            "structured_data": load_sample("case_structuring.json"),
             "active_typology_agents": [
                 "transaction_fraud",
                 "payment_velocity",
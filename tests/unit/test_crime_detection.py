@@ -2,18 +2,27 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator
+
 import pytest
 from src.agents.crime_detection import (
     _extract_risk_indicators,
     _classify_crime_types,
     crime_detection_agent,
 )
+from tests.conftest import unchanged
+
 
+@pytest.fixture(scope="module")
+def types_of() -> Callable[..., frozenset[str]]:
+    """``types_of(items)`` → frozenset of each item's ``"type"``, for O(1) membership asserts."""
+    return lambda items, key="type": frozenset(item[key] for item in items)
 
-@pytest.fixture
-def structuring_data() -> dict:
+
+@pytest.fixture(scope="module")
+def structuring_data() -> Iterator[dict]:
     """Case data with structuring patterns."""
-    return {
+    yield from unchanged({
         "case_id": "TEST-STR",
         "transactions": [
             {"txn_id": "T1", "amount": 9500, "type": "wire_out", "risk_flags": ["structured_amount"]},
@@ -28,13 +37,13 @@ def structuring_data() -> dict:
         },
         "flagged_communications": [],
         "related_entities": [],
-    }
+    })
 
 
-@pytest.fixture
-def layering_data() -> dict:
+@pytest.fixture(scope="module")
+def layering_data() -> Iterator[dict]:
     """Case data with layering + shell company patterns."""
-    return {
+    yield from unchanged({
         "case_id": "TEST-LAY",
         "transactions": [
             {
@@ -51,13 +60,13 @@ def layering_data() -> dict:
         "kyc": {"adverse_media_hits": [], "activity_mismatch": False},
         "flagged_communications": [],
         "related_entities": [],
-    }
+    })
 
 
-@pytest.fixture
-def clean_data() -> dict:
+@pytest.fixture(scope="module")
+def clean_data() -> Iterator[dict]:
     """Clean case data with no risk indicators."""
-    return {
+    yield from unchanged({
         "case_id": "TEST-CLEAN",
         "transactions": [
             {"txn_id": "T1", "amount": 500, "type": "deposit", "risk_flags": []},
@@ -71,49 +80,49 @@ def clean_data() -> dict:
         },
         "flagged_communications": [],
         "related_entities": [],
-    }
+    })
+
+
+@pytest.fixture(scope="module")
+def structuring_indicators(structuring_data: dict) -> Iterator[list[dict]]:
+    """``_extract_risk_indicators(structuring_data)``, computed once per module."""
+    yield from unchanged(_extract_risk_indicators(structuring_data))
+
+
+@pytest.fixture(scope="module")
+def layering_indicators(layering_data: dict) -> Iterator[list[dict]]:
+    """``_extract_risk_indicators(layering_data)``, computed once per module."""
+    yield from unchanged(_extract_risk_indicators(layering_data))
 
 
 class TestRiskIndicatorExtraction:
     """Tests for _extract_risk_indicators."""
 
-    def test_detects_structuring(self, structuring_data: dict) -> None:
-        indicators = _extract_risk_indicators(structuring_data)
-        types = [i["type"] for i in indicators]
-        assert "structuring" in types
+    def test_detects_structuring(self, structuring_indicators: list[dict], types_of) -> None:
+        assert "structuring" in types_of(structuring_indicators)
 
-    def test_detects_layering(self, layering_data: dict) -> None:
-        indicators = _extract_risk_indicators(layering_data)
-        types = [i["type"] for i in indicators]
-        assert "layering" in types
+    def test_detects_layering(self, layering_indicators: list[dict], types_of) -> None:
+        assert "layering" in types_of(layering_indicators)
 
-    def test_detects_shell_company(self, layering_data: dict) -> None:
-        indicators = _extract_risk_indicators(layering_data)
-        types = [i["type"] for i in indicators]
-        assert "shell_company" in types
+    def test_detects_shell_company(self, layering_indicators: list[dict], types_of) -> None:
+        assert "shell_company" in types_of(layering_indicators)
 
-    def test_detects_high_risk_jurisdiction(self, layering_data: dict) -> None:
-        indicators = _extract_risk_indicators(layering_data)
-        types = [i["type"] for i in indicators]
-        assert "high_risk_jurisdiction" in types
+    def test_detects_high_risk_jurisdiction(self, layering_indicators: list[dict], types_of) -> None:
+        assert "high_risk_jurisdiction" in types_of(layering_indicators)
 
-    def test_detects_kyc_mismatch(self, structuring_data: dict) -> None:
-        indicators = _extract_risk_indicators(structuring_data)
-        types = [i["type"] for i in indicators]
-        assert "kyc_mismatch" in types
+    def test_detects_kyc_mismatch(self, structuring_indicators: list[dict], types_of) -> None:
+        assert "kyc_mismatch" in types_of(structuring_indicators)
 
     def test_clean_data_minimal_indicators(self, clean_data: dict) -> None:
         indicators = _extract_risk_indicators(clean_data)
         assert len(indicators) == 0
 
-    def test_indicator_severity(self, structuring_data: dict) -> None:
-        indicators = _extract_risk_indicators(structuring_data)
-        structuring = [i for i in indicators if i["type"] == "structuring"][0]
+    def test_indicator_severity(self, structuring_indicators: list[dict]) -> None:
+        structuring = [i for i in structuring_indicators if i["type"] == "structuring"][0]
         assert structuring["severity"] == "high"
 
-    def test_indicator_has_evidence(self, structuring_data: dict) -> None:
-        indicators = _extract_risk_indicators(structuring_data)
-        for ind in indicators:
+    def test_indicator_has_evidence(self, structuring_indicators: list[dict]) -> None:
+        for ind in structuring_indicators:
             assert "evidence" in ind
             assert isinstance(ind["evidence"], list)
 
@@ -121,24 +130,22 @@ class TestRiskIndicatorExtraction:
 class TestCrimeTypeClassification:
     """Tests for _classify_crime_types."""
 
-    def test_classifies_structuring(self) -> None:
+    def test_classifies_structuring(self, types_of) -> None:
         indicators = [
             {"type": "structuring", "severity": "high", "description": "", "evidence": []},
             {"type": "kyc_mismatch", "severity": "medium", "description": "", "evidence": []},
         ]
         results = _classify_crime_types(indicators)
-        types = [r["type"] for r in results]
-        assert "structuring" in types
+        assert "structuring" in types_of(results)
 
-    def test_classifies_money_laundering(self) -> None:
+    def test_classifies_money_laundering(self, types_of) -> None:
         indicators = [
             {"type": "layering", "severity": "high", "description": "", "evidence": []},
             {"type": "shell_company", "severity": "medium", "description": "", "evidence": []},
             {"type": "high_risk_jurisdiction", "severity": "high", "description": "", "evidence": []},
         ]
         results = _classify_crime_types(indicators)
-        types = [r["type"] for r in results]
-        assert "money_laundering_layering" in types
+        assert "money_laundering_layering" in types_of(results)
 
     def test_confidence_bounded(self) -> None:
         indicators = [
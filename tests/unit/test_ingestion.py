@@ -2,107 +2,113 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+
 import pytest
 from src.agents.ingestion import data_ingestion_agent
-
-
-@pytest.fixture
-def sample_raw_data() -> dict:
-    """Minimal raw case data for testing."""
-    return {
-        "case_id": "TEST-001",
-        "alert_date": "2024-01-15",
-        "priority": "high",
-        "subject": {
-            "name": "Test Subject",
-            "dob": "1990-01-01",
-            "ssn": "123-45-6789",
-            "address": "123 Main St, Anytown, US 12345",
-            "phone": "+1-555-0100",
-            "email": "test@example.com",
-            "occupation": "Consultant",
-            "risk_rating": "medium",
-            "customer_since": "2020-01-01",
+from tests.conftest import unchanged
+
+# Minimal raw case data, built once at import; every test only reads it
+_SAMPLE_RAW_DATA: dict = {
+    "case_id": "TEST-001",
+    "alert_date": "2024-01-15",
+    "priority": "high",
+    "subject": {
+        "name": "Test Subject",
+        "dob": "1990-01-01",
+        "ssn": "123-45-6789",
+        "address": "123 Main St, Anytown, US 12345",
+        "phone": "+1-555-0100",
+        "email": "test@example.com",
+        "occupation": "Consultant",
+        "risk_rating": "medium",
+        "customer_since": "2020-01-01",
+    },
+    "accounts": [
+        {
+            "account_id": "ACC-001",
+            "account_type": "checking",
+            "balance": 50000.00,
+            "currency": "USD",
+            "branch": "Main Branch",
+        }
+    ],
+    "transactions": [
+        {
+            "txn_id": "TXN-001",
+            "date": "2024-01-10",
+            "type": "wire_out",
+            "amount": 9500.00,
+            "currency": "USD",
+            "from_account": "ACC-001",
+            "to_account": "EXT-001",
+            "from_entity": "Test Subject",
+            "to_entity": "Offshore Corp",
+            "from_country": "US",
+            "to_country": "PA",
+            "location": "Chicago",
+            "description": "Investment transfer",
+            "risk_flags": ["structured_amount"],
         },
-        "accounts": [
-            {
-                "account_id": "ACC-001",
-                "account_type": "checking",
-                "balance": 50000.00,
-                "currency": "USD",
-                "branch": "Main Branch",
-            }
-        ],
-        "transactions": [
-            {
-                "txn_id": "TXN-001",
-                "date": "2024-01-10",
-                "type": "wire_out",
-                "amount": 9500.00,
-                "currency": "USD",
-                "from_account": "ACC-001",
-                "to_account": "EXT-001",
-                "from_entity": "Test Subject",
-                "to_entity": "Offshore Corp",
-                "from_country": "US",
-                "to_country": "PA",
-                "location": "Chicago",
-                "description": "Investment transfer",
-                "risk_flags": ["structured_amount"],
-            },
-            {
-                "txn_id": "TXN-002",
-                "date": "2024-01-11",
-                "type": "wire_out",
-                "amount": 9800.00,
-                "currency": "USD",
-                "from_account": "ACC-001",
-                "to_account": "EXT-002",
-                "from_entity": "Test Subject",
-                "to_entity": "Shell LLC",
-                "from_country": "US",
-                "to_country": "BZ",
-                "location": "Chicago",
-                "description": "Consulting fee",
-                "risk_flags": ["structured_amount", "layering_pattern"],
-            },
-        ],
-        "kyc": {
-            "verification_status": "verified",
-            "source_of_funds": "salary",
-            "expected_activity": "low",
-            "actual_activity_profile": "high",
-            "pep_status": False,
-            "adverse_media_hits": [],
+        {
+            "txn_id": "TXN-002",
+            "date": "2024-01-11",
+            "type": "wire_out",
+            "amount": 9800.00,
+            "currency": "USD",
+            "from_account": "ACC-001",
+            "to_account": "EXT-002",
+            "from_entity": "Test Subject",
+            "to_entity": "Shell LLC",
+            "from_country": "US",
+            "to_country": "BZ",
+            "location": "Chicago",
+            "description": "Consulting fee",
+            "risk_flags": ["structured_amount", "layering_pattern"],
         },
-        "communications": [
-            {
-                "date": "2024-01-09",
-                "channel": "email",
-                "content": "Send the wire immediately, must be under 10k",
-                "flagged": True,
-                "flag_reason": "structuring_language",
-            }
-        ],
-        "alerts": [
-            {
-                "alert_id": "ALT-001",
-                "type": "structuring",
-                "severity": "high",
-                "description": "Multiple transactions just below $10,000",
-                "triggered_date": "2024-01-12",
-            }
-        ],
-        "related_entities": [
-            {
-                "entity_name": "Offshore Corp",
-                "entity_type": "company",
-                "jurisdiction": "PA",
-                "relationship": "counterparty",
-                "risk_notes": "Shell company in Panama",
-            }
-        ],
-    }
+    ],
+    "kyc": {
+        "verification_status": "verified",
+        "source_of_funds": "salary",
+        "expected_activity": "low",
+        "actual_activity_profile": "high",
+        "pep_status": False,
+        "adverse_media_hits": [],
+    },
+    "communications": [
+        {
+            "date": "2024-01-09",
+            "channel": "email",
+            "content": "Send the wire immediately, must be under 10k",
+            "flagged": True,
+            "flag_reason": "structuring_language",
+        }
+    ],
+    "alerts": [
+        {
+            "alert_id": "ALT-001",
+            "type": "structuring",
+            "severity": "high",
+            "description": "Multiple transactions just below $10,000",
+            "triggered_date": "2024-01-12",
+        }
+    ],
+    "related_entities": [
+        {
+            "entity_name": "Offshore Corp",
+            "entity_type": "company",
+            "jurisdiction": "PA",
+            "relationship": "counterparty",
+            "risk_notes": "Shell company in Panama",
+        }
+    ],
+}
+
+
+@pytest.fixture(scope="module")
+def sample_raw_data() -> Iterator[dict]:
+    """Minimal raw case data for testing (shared across the module)."""
+    yield from unchanged(_SAMPLE_RAW_DATA)
 
 
 class TestDataIngestionAgent:
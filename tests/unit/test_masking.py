@@ -0,0 +1,60 @@
+"""Unit tests for the UI PII masking helpers."""
+
+from __future__ import annotations
+
+import pytest
+from src.ui.masking import preview, remask, unmask
+
+
+@pytest.fixture
+def reverse_map() -> dict[str, str]:
+    """Placeholder → original mapping with a prefix-overlapping pair."""
+    return {
+        "[ENTITY_1]": "Acme",
+        "[ENTITY_10]": "Acme Holdings",
+        "[PERSON_1]": "Jane Doe",
+    }
+
+
+class TestUnmask:
+    """Tests for placeholder → original replacement."""
+
+    def test_replaces_all_placeholders(self, reverse_map: dict) -> None:
+        text = "[PERSON_1] owns [ENTITY_1]."
+        assert unmask(text, reverse_map) == "Jane Doe owns Acme."
+
+    def test_longest_placeholder_wins(self, reverse_map: dict) -> None:
+        assert unmask("[ENTITY_10] / [ENTITY_1]", reverse_map) == "Acme Holdings / Acme"
+
+    def test_empty_inputs_passthrough(self, reverse_map: dict) -> None:
+        assert unmask("", reverse_map) == ""
+        assert unmask("[ENTITY_1]", {}) == "[ENTITY_1]"
+
+
+class TestRemask:
+    """Tests for original → placeholder replacement."""
+
+    def test_round_trip(self, reverse_map: dict) -> None:
+        text = "[PERSON_1] moved funds from [ENTITY_10] to [ENTITY_1]."
+        assert remask(unmask(text, reverse_map), reverse_map) == text
+
+    def test_longest_original_wins(self, reverse_map: dict) -> None:
+        assert remask("Acme Holdings", reverse_map) == "[ENTITY_10]"
+
+    def test_empty_original_ignored(self) -> None:
+        assert remask("some text", {"[X_1]": ""}) == "some text"
+
+
+class TestPreview:
+    """Tests for the whitespace-bounded narrative preview."""
+
+    def test_short_text_unchanged(self) -> None:
+        assert preview("short text", limit=200) == "short text"
+
+    def test_cuts_before_partial_placeholder(self) -> None:
+        text = "Funds moved from " + "x" * 10 + " to [ENTITY_12] later"
+        assert preview(text, limit=len(text) - 10) == "Funds moved from " + "x" * 10 + " to"
+
+    def test_hard_cut_without_late_break(self) -> None:
+        text = "a " + "b" * 300
+        assert preview(text, limit=200) == text[:200]
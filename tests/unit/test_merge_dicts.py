@@ -0,0 +1,52 @@
+"""Unit tests for the _merge_dicts reducer that fans in parallel typology results.
+
+Kept apart from the agent tests so running this file alone imports only
+``src.core.state``, not the seven typology agent modules. The hypothesis
+properties live in ``test_merge_dicts_properties.py``.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from src.core.state import _merge_dicts
+
+
+@pytest.mark.fast
+class TestMergeDictsReducer:
+    """Test the _merge_dicts reducer used for parallel typology results."""
+
+    @pytest.mark.parametrize(
+        ("left", "right"),
+        [
+            ({}, {"a": 1}),
+            ({"a": 1}, {}),
+            ({}, {}),
+            ({"a": 1}, {"b": 2}),
+            ({"a": 1}, {"a": 2}),
+        ],
+        ids=["empty_left", "empty_right", "both_empty", "non_overlapping", "right_wins"],
+    )
+    def test_merge_matches_unpacking(self, left: dict, right: dict) -> None:
+        assert _merge_dicts(left, right) == {**left, **right}
+
+    def test_merge_returns_new_dict(self) -> None:
+        """The reducer never hands back or mutates an input dict."""
+        left, right = {"a": 1}, {"b": 2}
+        result = _merge_dicts(left, right)
+        assert result is not left and result is not right
+        assert left == {"a": 1} and right == {"b": 2}
+        assert _merge_dicts({}, right) is not right
+
+    def test_merge_none_inputs(self) -> None:
+        assert _merge_dicts(None, {"a": 1}) == {"a": 1}
+        assert _merge_dicts({"a": 1}, None) == {"a": 1}
+
+    @pytest.mark.parametrize("k", [3, 10, 100])
+    def test_merge_fan_in_of_k_agents(self, k: int) -> None:
+        """Folding k single-key agent outputs keeps every key once."""
+        accumulated: dict = {}
+        for i in range(k):
+            accumulated = _merge_dicts(accumulated, {f"agent_{i}": {"risk_score": i / k}})
+        assert len(accumulated) == k
+        assert accumulated[f"agent_{k - 1}"]["risk_score"] == (k - 1) / k
@@ -0,0 +1,39 @@
+"""Hypothesis property tests for the _merge_dicts reducer.
+
+In their own module so that, without hypothesis installed, the whole file
+is reported as skipped instead of the properties silently not existing.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("hypothesis")
+
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from src.core.state import _merge_dicts
+
+_small_dicts = st.dictionaries(st.text(max_size=4), st.integers(), max_size=8)
+
+
+@pytest.mark.fast
+class TestMergeDictsProperties:
+    """Properties of the _merge_dicts reducer over generated agent outputs."""
+
+    @settings(max_examples=50)
+    @given(left=_small_dicts, right=_small_dicts)
+    def test_merge_matches_unpacking(self, left: dict, right: dict) -> None:
+        assert _merge_dicts(left, right) == {**left, **right}
+
+    @settings(max_examples=50)
+    @given(outputs=st.lists(_small_dicts, max_size=10))
+    def test_merge_fold_matches_sequential_update(self, outputs: list[dict]) -> None:
+        """Folding agent outputs in order equals updating one dict in that order."""
+        accumulated: dict = {}
+        expected: dict = {}
+        for output in outputs:
+            accumulated = _merge_dicts(accumulated, output)
+            expected.update(output)
+        assert accumulated == expected